@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from arp_auth import AuthClient, AuthError
 from arp_standard_server import ArpServerError, AuthSettings
@@ -45,18 +47,60 @@ def outbound_auth_disabled() -> bool:
         return (os.environ.get("ARP_AUTH_MODE") or "").strip().lower() == "disabled"
 
 
+# arp-auth's token exchange is blocking; run it on a dedicated pool so it never queues behind other work
+# (e.g. DNS lookups) on the loop's default executor. Requests are coalesced below, so a few workers suffice.
+_token_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="arp-auth-token")
+
+# In-flight client-credentials requests, keyed by (auth_client, audience, scope). Concurrent callers share one.
+_token_requests: dict[tuple[object, str | None, str | None], asyncio.Task[str]] = {}
+
+
 async def client_credentials_token(
     auth_client: AuthClient,
     *,
     audience: str | None,
     scope: str | None,
     service_label: str,
+) -> str:
+    """
+    Return a client-credentials access token for an outbound call.
+
+    Concurrent requests for the same client/audience/scope are coalesced into a single STS round-trip, so a burst
+    of NodeRun dispatches costs one token request instead of one per RPC.
+    """
+    key = (auth_client, audience, scope)
+    task = _token_requests.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(
+            _request_client_credentials_token(
+                auth_client,
+                audience=audience,
+                scope=scope,
+                service_label=service_label,
+            )
+        )
+        _token_requests[key] = task
+
+        def _forget(done: asyncio.Task[str]) -> None:
+            if _token_requests.get(key) is done:
+                del _token_requests[key]
+
+        task.add_done_callback(_forget)
+    # Shield the shared request so one cancelled caller does not cancel the others.
+    return await asyncio.shield(task)
+
+
+async def _request_client_credentials_token(
+    auth_client: AuthClient,
+    *,
+    audience: str | None,
+    scope: str | None,
+    service_label: str,
 ) -> str:
     try:
-        token = await asyncio.to_thread(
-            auth_client.client_credentials,
-            audience=audience,
-            scope=scope,
+        token = await asyncio.get_running_loop().run_in_executor(
+            _token_executor,
+            functools.partial(auth_client.client_credentials, audience=audience, scope=scope),
         )
     except Exception as exc:
         raise ArpServerError(
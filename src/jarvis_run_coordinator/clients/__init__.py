@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ._gateway import register_inprocess_server, unregister_inprocess_server
 from .artifact_store import ArtifactStoreClient
 from .atomic_executor_client import AtomicExecutorGatewayClient
 from .composite_executor_client import CompositeExecutorGatewayClient
@@ -22,4 +23,6 @@ __all__ = [
     "RunStoreClient",
     "RunStoreClientLike",
     "SelectionGatewayClient",
+    "register_inprocess_server",
+    "unregister_inprocess_server",
 ]
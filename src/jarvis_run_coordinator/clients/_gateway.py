@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar
+
+import httpx
+from arp_auth import AuthClient
+from arp_standard_client.errors import ArpApiError
+from arp_standard_model import ErrorEnvelope, Health, VersionInfo
+from arp_standard_server import ArpServerError
+
+from ..auth import client_credentials_token
+
+# Connection pool shared by every call of a gateway client. HTTP/2 is negotiated via ALPN when the peer supports it.
+GATEWAY_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=128)
+
+
+def gateway_httpx_args() -> dict[str, Any]:
+    """Return `httpx_args` for SDK clients built by the gateway wrappers (pool limits + HTTP/2)."""
+    return {"http2": True, "limits": GATEWAY_HTTP_LIMITS}
+
+
+# `inprocess://` base URLs route gateway calls straight to a co-located server object (no HTTP, JSON or auth hop).
+INPROCESS_SCHEME = "inprocess://"
+_inprocess_servers: dict[str, Any] = {}
+
+
+def register_inprocess_server(base_url: str, server: Any) -> None:
+    """
+    Serve gateway calls for `base_url` from `server` in the same process.
+
+    `server` exposes the same async methods as the SDK clients (e.g. a `BaseAtomicExecutorServer` subclass).
+    """
+    if not base_url.startswith(INPROCESS_SCHEME):
+        raise ValueError(f"In-process base_url must start with {INPROCESS_SCHEME!r}: {base_url!r}")
+    _inprocess_servers[base_url] = server
+
+
+def unregister_inprocess_server(base_url: str) -> None:
+    _inprocess_servers.pop(base_url, None)
+
+
+def inprocess_server(base_url: str) -> Any:
+    """Return the server registered for `base_url` (raises LookupError when none is registered)."""
+    try:
+        return _inprocess_servers[base_url]
+    except KeyError:
+        raise LookupError(f"No in-process server registered for {base_url!r}") from None
+
+
+def unwrap_response(response: Any, *, allow_none: bool = False) -> Any:
+    """
+    Return the parsed body of a generated `asyncio_detailed` response.
+
+    Mirrors the SDK facades: error envelopes and unexpected empty bodies are raised as `ArpApiError`.
+    """
+    parsed = response.parsed
+    if parsed is None:
+        if allow_none:
+            return None
+        raise ArpApiError(
+            code="unexpected_empty_response",
+            message="API returned an empty response",
+            status_code=int(response.status_code),
+            raw=response.content,
+        )
+    if isinstance(parsed, ErrorEnvelope):
+        raise ArpApiError(
+            code=str(parsed.error.code),
+            message=str(parsed.error.message),
+            details=parsed.error.details,
+            status_code=int(response.status_code),
+            raw=parsed.model_dump(mode="json", exclude_none=True),
+        )
+    return parsed
+
+
+class _AsyncSdkClient:
+    """
+    Shared base of the async SDK facades built on the generated `asyncio_detailed` endpoints.
+
+    Subclasses set the generated `health` / `version` endpoint modules and add their endpoint-specific methods.
+    """
+
+    _health_endpoint: ClassVar[Any]
+    _version_endpoint: ClassVar[Any]
+
+    def __init__(self, *, client: Any) -> None:
+        self._client = client
+
+    @property
+    def raw_client(self) -> Any:
+        return self._client
+
+    async def health(self, request: Any) -> Health:
+        _ = request
+        return unwrap_response(await self._health_endpoint.asyncio_detailed(client=self._client))
+
+    async def version(self, request: Any) -> VersionInfo:
+        _ = request
+        return unwrap_response(await self._version_endpoint.asyncio_detailed(client=self._client))
+
+
+class _GatewayClient:
+    """
+    Shared plumbing for the outgoing gateway clients.
+
+    Subclasses set the ClassVars used for error translation and token requests, and expose typed methods that
+    forward to `_call` with the generated `*Request` envelope.
+    """
+
+    _failure_code: ClassVar[str]
+    _url_field_name: ClassVar[str]
+    _service_label: ClassVar[str]
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        auth_client: AuthClient,
+        audience: str | None,
+        scope: str | None,
+        client: Any,
+        client_factory: Callable[[Any], Any],
+    ) -> None:
+        self.base_url = base_url
+        self._client = client
+        self._auth_client = auth_client
+        self._audience = audience
+        self._scope = scope
+        self._client_factory = client_factory
+        self._inprocess = base_url.startswith(INPROCESS_SCHEME)
+
+    # Helpers (internal): implementation detail for the reference implementation.
+    async def _call(self, method_name: str, request: Any) -> Any:
+        try:
+            # Co-located peer: call the server object directly, skipping token, HTTP and JSON.
+            client = inprocess_server(self.base_url) if self._inprocess else await self._client_for()
+            fn: Callable[[Any], Awaitable[Any]] = getattr(client, method_name)
+            return await fn(request)
+        except ArpServerError:
+            raise
+        except ArpApiError as exc:
+            raise ArpServerError(
+                code=exc.code,
+                message=exc.message,
+                status_code=exc.status_code or 502,
+                details=exc.details,
+            ) from exc
+        except Exception as exc:
+            raise ArpServerError(
+                code=self._failure_code,
+                message=f"{self._service_label} request failed",
+                status_code=502,
+                details={
+                    self._url_field_name: self.base_url,
+                    "error": str(exc),
+                },
+            ) from exc
+
+    async def _client_for(self) -> Any:
+        bearer_token = await client_credentials_token(
+            self._auth_client,
+            audience=self._audience,
+            scope=self._scope,
+            service_label=self._service_label,
+        )
+        # Share one pooled AsyncClient across calls; with_headers() refreshes its Authorization header in place.
+        raw_client = self._client.raw_client
+        http_client = raw_client.get_async_httpx_client()
+        raw_client = raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
+        return self._client_factory(raw_client.set_async_httpx_client(http_client))
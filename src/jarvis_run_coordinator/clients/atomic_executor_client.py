@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Any, ClassVar
 
 from arp_auth import AuthClient
 from arp_standard_client.atomic_executor import AtomicExecutorClient
-from arp_standard_client.errors import ArpApiError
+from arp_standard_client.atomic_executor.api.atomic_node_runs import cancel_atomic_node_run, execute_atomic_node_run
+from arp_standard_client.atomic_executor.api.health import health
+from arp_standard_client.atomic_executor.api.version import version
 from arp_standard_model import (
     AtomicExecuteRequest,
     AtomicExecuteResult,
@@ -18,13 +20,36 @@ from arp_standard_model import (
     Health,
     VersionInfo,
 )
-from arp_standard_server import ArpServerError
 
-from ..auth import client_credentials_token
+from ._gateway import _AsyncSdkClient, _GatewayClient, gateway_httpx_args, unwrap_response
 
-class AtomicExecutorGatewayClient:
+
+class AsyncAtomicExecutorClient(_AsyncSdkClient):
+    """Async counterpart of `AtomicExecutorClient` built on the generated `asyncio_detailed` endpoints."""
+
+    _health_endpoint: ClassVar[Any] = health
+    _version_endpoint: ClassVar[Any] = version
+
+    async def execute_atomic_node_run(self, request: AtomicExecutorExecuteAtomicNodeRunRequest) -> AtomicExecuteResult:
+        resp = await execute_atomic_node_run.asyncio_detailed(client=self._client, body=request.body)
+        return unwrap_response(resp)
+
+    async def cancel_atomic_node_run(self, request: AtomicExecutorCancelAtomicNodeRunRequest) -> None:
+        resp = await cancel_atomic_node_run.asyncio_detailed(
+            client=self._client,
+            node_run_id=request.params.node_run_id,
+        )
+        unwrap_response(resp, allow_none=True)
+        return None
+
+
+class AtomicExecutorGatewayClient(_GatewayClient):
     """Outgoing Atomic Executor client wrapper for the Run Coordinator."""
 
+    _failure_code: ClassVar[str] = "atomic_executor_unavailable"
+    _url_field_name: ClassVar[str] = "atomic_executor_url"
+    _service_label: ClassVar[str] = "Atomic Executor"
+
     # Core method - API surface and main extension points
     def __init__(
         self,
@@ -34,72 +59,44 @@ class AtomicExecutorGatewayClient:
         audience: str | None = None,
         scope: str | None = None,
         client: AtomicExecutorClient | None = None,
-        client_factory: Callable[[Any], AtomicExecutorClient] | None = None,
+        client_factory: Callable[[Any], AsyncAtomicExecutorClient] | None = None,
     ) -> None:
-        self.base_url = base_url
-        self._client = client or AtomicExecutorClient(base_url=base_url)
-        self._auth_client = auth_client
-        self._audience = audience
-        self._scope = scope
-        self._client_factory = client_factory or (lambda raw_client: AtomicExecutorClient(client=raw_client))
+        super().__init__(
+            base_url=base_url,
+            auth_client=auth_client,
+            audience=audience,
+            scope=scope,
+            client=client or AtomicExecutorClient(base_url=base_url, httpx_args=gateway_httpx_args()),
+            client_factory=client_factory or (lambda raw_client: AsyncAtomicExecutorClient(client=raw_client)),
+        )
 
     # Core methods - outgoing Atomic Executor calls
     async def execute_atomic_node_run(self, body: AtomicExecuteRequest) -> AtomicExecuteResult:
         return await self._call(
             "execute_atomic_node_run",
-            AtomicExecutorExecuteAtomicNodeRunRequest(body=body),
+            AtomicExecutorExecuteAtomicNodeRunRequest.model_construct(body=body),
         )
 
+    async def execute_many(self, bodies: list[AtomicExecuteRequest]) -> list[AtomicExecuteResult]:
+        """Execute several atomic NodeRuns concurrently over the shared connection pool (results keep input order)."""
+        return list(await asyncio.gather(*(self.execute_atomic_node_run(body) for body in bodies)))
+
     async def cancel_atomic_node_run(self, node_run_id: str) -> None:
         return await self._call(
             "cancel_atomic_node_run",
-            AtomicExecutorCancelAtomicNodeRunRequest(
-                params=AtomicExecutorCancelAtomicNodeRunParams(node_run_id=node_run_id)
+            AtomicExecutorCancelAtomicNodeRunRequest.model_construct(
+                params=AtomicExecutorCancelAtomicNodeRunParams.model_construct(node_run_id=node_run_id)
             ),
         )
 
     async def health(self) -> Health:
         return await self._call(
             "health",
-            AtomicExecutorHealthRequest(),
+            AtomicExecutorHealthRequest.model_construct(),
         )
 
     async def version(self) -> VersionInfo:
         return await self._call(
             "version",
-            AtomicExecutorVersionRequest(),
-        )
-
-    # Helpers (internal): implementation detail for the reference implementation.
-    async def _call(self, method_name: str, request: Any) -> Any:
-        client = await self._client_for()
-        fn: Callable[[Any], Any] = getattr(client, method_name)
-        try:
-            return await asyncio.to_thread(fn, request)
-        except ArpApiError as exc:
-            raise ArpServerError(
-                code=exc.code,
-                message=exc.message,
-                status_code=exc.status_code or 502,
-                details=exc.details,
-            ) from exc
-        except Exception as exc:
-            raise ArpServerError(
-                code="atomic_executor_unavailable",
-                message="Atomic Executor request failed",
-                status_code=502,
-                details={
-                    "atomic_executor_url": self.base_url,
-                    "error": str(exc),
-                },
-            ) from exc
-
-    async def _client_for(self) -> AtomicExecutorClient:
-        bearer_token = await client_credentials_token(
-            self._auth_client,
-            audience=self._audience,
-            scope=self._scope,
-            service_label="Atomic Executor",
+            AtomicExecutorVersionRequest.model_construct(),
         )
-        raw_client = self._client.raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
-        return self._client_factory(raw_client)
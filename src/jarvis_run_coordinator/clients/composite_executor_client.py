@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Any, ClassVar
 
 from arp_auth import AuthClient
 from arp_standard_client.composite_executor import CompositeExecutorClient
-from arp_standard_client.errors import ArpApiError
+from arp_standard_client.composite_executor.api.composite_node_runs import (
+    begin_composite_node_run,
+    cancel_composite_node_run,
+)
+from arp_standard_client.composite_executor.api.health import health
+from arp_standard_client.composite_executor.api.version import version
 from arp_standard_model import (
     CompositeBeginRequest,
     CompositeBeginResponse,
@@ -18,13 +23,38 @@ from arp_standard_model import (
     Health,
     VersionInfo,
 )
-from arp_standard_server import ArpServerError
 
-from ..auth import client_credentials_token
+from ._gateway import _AsyncSdkClient, _GatewayClient, gateway_httpx_args, unwrap_response
+
+
+class AsyncCompositeExecutorClient(_AsyncSdkClient):
+    """Async counterpart of `CompositeExecutorClient` built on the generated `asyncio_detailed` endpoints."""
+
+    _health_endpoint: ClassVar[Any] = health
+    _version_endpoint: ClassVar[Any] = version
+
+    async def begin_composite_node_run(
+        self, request: CompositeExecutorBeginCompositeNodeRunRequest
+    ) -> CompositeBeginResponse:
+        resp = await begin_composite_node_run.asyncio_detailed(client=self._client, body=request.body)
+        return unwrap_response(resp)
+
+    async def cancel_composite_node_run(self, request: CompositeExecutorCancelCompositeNodeRunRequest) -> None:
+        resp = await cancel_composite_node_run.asyncio_detailed(
+            client=self._client,
+            node_run_id=request.params.node_run_id,
+        )
+        unwrap_response(resp, allow_none=True)
+        return None
 
-class CompositeExecutorGatewayClient:
+
+class CompositeExecutorGatewayClient(_GatewayClient):
     """Outgoing Composite Executor client wrapper for the Run Coordinator."""
 
+    _failure_code: ClassVar[str] = "composite_executor_unavailable"
+    _url_field_name: ClassVar[str] = "composite_executor_url"
+    _service_label: ClassVar[str] = "Composite Executor"
+
     # Core method - API surface and main extension points
     def __init__(
         self,
@@ -34,72 +64,44 @@ class CompositeExecutorGatewayClient:
         audience: str | None = None,
         scope: str | None = None,
         client: CompositeExecutorClient | None = None,
-        client_factory: Callable[[Any], CompositeExecutorClient] | None = None,
+        client_factory: Callable[[Any], AsyncCompositeExecutorClient] | None = None,
     ) -> None:
-        self.base_url = base_url
-        self._client = client or CompositeExecutorClient(base_url=base_url)
-        self._auth_client = auth_client
-        self._audience = audience
-        self._scope = scope
-        self._client_factory = client_factory or (lambda raw_client: CompositeExecutorClient(client=raw_client))
+        super().__init__(
+            base_url=base_url,
+            auth_client=auth_client,
+            audience=audience,
+            scope=scope,
+            client=client or CompositeExecutorClient(base_url=base_url, httpx_args=gateway_httpx_args()),
+            client_factory=client_factory or (lambda raw_client: AsyncCompositeExecutorClient(client=raw_client)),
+        )
 
     # Core methods - outgoing Composite Executor calls
     async def begin_composite_node_run(self, body: CompositeBeginRequest) -> CompositeBeginResponse:
         return await self._call(
             "begin_composite_node_run",
-            CompositeExecutorBeginCompositeNodeRunRequest(body=body),
+            CompositeExecutorBeginCompositeNodeRunRequest.model_construct(body=body),
         )
 
+    async def begin_many(self, bodies: list[CompositeBeginRequest]) -> list[CompositeBeginResponse]:
+        """Begin several composite NodeRuns concurrently over the shared connection pool (results keep input order)."""
+        return list(await asyncio.gather(*(self.begin_composite_node_run(body) for body in bodies)))
+
     async def cancel_composite_node_run(self, node_run_id: str) -> None:
         return await self._call(
             "cancel_composite_node_run",
-            CompositeExecutorCancelCompositeNodeRunRequest(
-                params=CompositeExecutorCancelCompositeNodeRunParams(node_run_id=node_run_id)
+            CompositeExecutorCancelCompositeNodeRunRequest.model_construct(
+                params=CompositeExecutorCancelCompositeNodeRunParams.model_construct(node_run_id=node_run_id)
             ),
         )
 
     async def health(self) -> Health:
         return await self._call(
             "health",
-            CompositeExecutorHealthRequest(),
+            CompositeExecutorHealthRequest.model_construct(),
         )
 
     async def version(self) -> VersionInfo:
         return await self._call(
             "version",
-            CompositeExecutorVersionRequest(),
-        )
-
-    # Helpers (internal): implementation detail for the reference implementation.
-    async def _call(self, method_name: str, request: Any) -> Any:
-        client = await self._client_for()
-        fn: Callable[[Any], Any] = getattr(client, method_name)
-        try:
-            return await asyncio.to_thread(fn, request)
-        except ArpApiError as exc:
-            raise ArpServerError(
-                code=exc.code,
-                message=exc.message,
-                status_code=exc.status_code or 502,
-                details=exc.details,
-            ) from exc
-        except Exception as exc:
-            raise ArpServerError(
-                code="composite_executor_unavailable",
-                message="Composite Executor request failed",
-                status_code=502,
-                details={
-                    "composite_executor_url": self.base_url,
-                    "error": str(exc),
-                },
-            ) from exc
-
-    async def _client_for(self) -> CompositeExecutorClient:
-        bearer_token = await client_credentials_token(
-            self._auth_client,
-            audience=self._audience,
-            scope=self._scope,
-            service_label="Composite Executor",
+            CompositeExecutorVersionRequest.model_construct(),
         )
-        raw_client = self._client.raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
-        return self._client_factory(raw_client)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Any, ClassVar
 
 from arp_auth import AuthClient
-from arp_standard_client.errors import ArpApiError
 from arp_standard_client.node_registry import NodeRegistryClient
+from arp_standard_client.node_registry.api.health import health
+from arp_standard_client.node_registry.api.node_types import get_node_type, list_node_types, publish_node_type
+from arp_standard_client.node_registry.api.version import version
+from arp_standard_client.node_registry.types import UNSET
 from arp_standard_model import (
     Health,
     NodeKind,
@@ -21,13 +23,46 @@ from arp_standard_model import (
     NodeTypePublishRequest,
     VersionInfo,
 )
-from arp_standard_server import ArpServerError
 
-from ..auth import client_credentials_token, outbound_auth_disabled
+from ..auth import outbound_auth_disabled
+from ._gateway import _AsyncSdkClient, _GatewayClient, gateway_httpx_args, unwrap_response
 
-class NodeRegistryGatewayClient:
+
+class AsyncNodeRegistryClient(_AsyncSdkClient):
+    """Async counterpart of `NodeRegistryClient` built on the generated `asyncio_detailed` endpoints."""
+
+    _health_endpoint: ClassVar[Any] = health
+    _version_endpoint: ClassVar[Any] = version
+
+    async def publish_node_type(self, request: NodeRegistryPublishNodeTypeRequest) -> NodeType:
+        return unwrap_response(await publish_node_type.asyncio_detailed(client=self._client, body=request.body))
+
+    async def get_node_type(self, request: NodeRegistryGetNodeTypeRequest) -> NodeType:
+        params = request.params
+        resp = await get_node_type.asyncio_detailed(
+            client=self._client,
+            node_type_id=params.node_type_id,
+            version=UNSET if params.version is None else params.version,
+        )
+        return unwrap_response(resp)
+
+    async def list_node_types(self, request: NodeRegistryListNodeTypesRequest) -> list[NodeType]:
+        params = request.params
+        resp = await list_node_types.asyncio_detailed(
+            client=self._client,
+            q=UNSET if params.q is None else params.q,
+            kind=UNSET if params.kind is None else params.kind,
+        )
+        return unwrap_response(resp)
+
+
+class NodeRegistryGatewayClient(_GatewayClient):
     """Outgoing Node Registry client wrapper for the Run Coordinator."""
 
+    _failure_code: ClassVar[str] = "node_registry_unavailable"
+    _url_field_name: ClassVar[str] = "node_registry_url"
+    _service_label: ClassVar[str] = "Node Registry"
+
     # Core method - API surface and main extension points
     def __init__(
         self,
@@ -37,81 +72,57 @@ class NodeRegistryGatewayClient:
         audience: str | None = None,
         scope: str | None = None,
         client: NodeRegistryClient | None = None,
-        client_factory: Callable[[Any], NodeRegistryClient] | None = None,
+        client_factory: Callable[[Any], AsyncNodeRegistryClient] | None = None,
     ) -> None:
-        self.base_url = base_url
-        self._client = client or NodeRegistryClient(base_url=base_url)
-        self._auth_client = auth_client
-        self._audience = audience
-        self._scope = scope
-        self._client_factory = client_factory or (lambda raw_client: NodeRegistryClient(client=raw_client))
+        super().__init__(
+            base_url=base_url,
+            auth_client=auth_client,
+            audience=audience,
+            scope=scope,
+            client=client or NodeRegistryClient(base_url=base_url, httpx_args=gateway_httpx_args()),
+            client_factory=client_factory or (lambda raw_client: AsyncNodeRegistryClient(client=raw_client)),
+        )
 
     # Core methods - outgoing Node Registry calls
     async def publish_node_type(self, node_type: NodeType) -> NodeType:
         return await self._call(
             "publish_node_type",
-            NodeRegistryPublishNodeTypeRequest(body=NodeTypePublishRequest(node_type=node_type)),
+            NodeRegistryPublishNodeTypeRequest.model_construct(
+                body=NodeTypePublishRequest.model_construct(node_type=node_type)
+            ),
         )
 
     async def get_node_type(self, node_type_id: str, version: str | None = None) -> NodeType:
         return await self._call(
             "get_node_type",
-            NodeRegistryGetNodeTypeRequest(
-                params=NodeRegistryGetNodeTypeParams(node_type_id=node_type_id, version=version)
+            NodeRegistryGetNodeTypeRequest.model_construct(
+                params=NodeRegistryGetNodeTypeParams.model_construct(node_type_id=node_type_id, version=version)
             ),
         )
 
     async def list_node_types(self, q: str | None = None, kind: NodeKind | None = None) -> list[NodeType]:
         return await self._call(
             "list_node_types",
-            NodeRegistryListNodeTypesRequest(params=NodeRegistryListNodeTypesParams(q=q, kind=kind)),
+            NodeRegistryListNodeTypesRequest.model_construct(
+                params=NodeRegistryListNodeTypesParams.model_construct(q=q, kind=kind)
+            ),
         )
 
     async def health(self) -> Health:
         return await self._call(
             "health",
-            NodeRegistryHealthRequest(),
+            NodeRegistryHealthRequest.model_construct(),
         )
 
     async def version(self) -> VersionInfo:
         return await self._call(
             "version",
-            NodeRegistryVersionRequest(),
+            NodeRegistryVersionRequest.model_construct(),
         )
 
     # Helpers (internal): implementation detail for the reference implementation.
-    async def _call(self, method_name: str, request: Any) -> Any:
-        client = await self._client_for()
-        fn: Callable[[Any], Any] = getattr(client, method_name)
-        try:
-            return await asyncio.to_thread(fn, request)
-        except ArpApiError as exc:
-            raise ArpServerError(
-                code=exc.code,
-                message=exc.message,
-                status_code=exc.status_code or 502,
-                details=exc.details,
-            ) from exc
-        except Exception as exc:
-            raise ArpServerError(
-                code="node_registry_unavailable",
-                message="Node Registry request failed",
-                status_code=502,
-                details={
-                    "node_registry_url": self.base_url,
-                    "error": str(exc),
-                },
-            ) from exc
-
-    async def _client_for(self) -> NodeRegistryClient:
+    async def _client_for(self) -> AsyncNodeRegistryClient:
+        # Node type lookups also run in local setups where outbound auth is disabled.
         if outbound_auth_disabled():
             return self._client_factory(self._client.raw_client)
-
-        bearer_token = await client_credentials_token(
-            self._auth_client,
-            audience=self._audience,
-            scope=self._scope,
-            service_label="Node Registry",
-        )
-        raw_client = self._client.raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
-        return self._client_factory(raw_client)
+        return await super()._client_for()
@@ -6,6 +6,7 @@ import httpx
 from arp_auth import AuthClient
 from arp_standard_model import NodeRun, Run
 from arp_standard_server import ArpServerError
+from pydantic_core import to_json
 
 from ..auth import client_credentials_token
 from ..utils import normalize_base_url
@@ -33,7 +34,7 @@ class RunStoreClient:
             self.base_url = normalize_base_url(str(client.base_url))
 
     async def create_run(self, run: Run, *, idempotency_key: str | None = None) -> Run:
-        payload: dict[str, Any] = {"run": run.model_dump(mode="json")}
+        payload: dict[str, Any] = {"run": run}
         if idempotency_key:
             payload["idempotency_key"] = idempotency_key
         response = await self._request("POST", "/v1/runs", json=payload)
@@ -54,7 +55,7 @@ class RunStoreClient:
         return Run.model_validate(data["run"])
 
     async def update_run(self, run: Run) -> Run:
-        response = await self._request("PUT", f"/v1/runs/{run.run_id}", json={"run": run.model_dump(mode="json")})
+        response = await self._request("PUT", f"/v1/runs/{run.run_id}", json={"run": run})
         if response.status_code == 404:
             raise ArpServerError(
                 code="run_not_found",
@@ -65,7 +66,7 @@ class RunStoreClient:
         return Run.model_validate(data["run"])
 
     async def create_node_run(self, node_run: NodeRun, *, idempotency_key: str | None = None) -> NodeRun:
-        payload: dict[str, Any] = {"node_run": node_run.model_dump(mode="json")}
+        payload: dict[str, Any] = {"node_run": node_run}
         if idempotency_key:
             payload["idempotency_key"] = idempotency_key
         response = await self._request("POST", "/v1/node-runs", json=payload)
@@ -89,7 +90,7 @@ class RunStoreClient:
         response = await self._request(
             "PUT",
             f"/v1/node-runs/{node_run.node_run_id}",
-            json={"node_run": node_run.model_dump(mode="json")},
+            json={"node_run": node_run},
         )
         if response.status_code == 404:
             raise ArpServerError(
@@ -132,8 +133,13 @@ class RunStoreClient:
                 service_label="Run Store",
             )
             headers["Authorization"] = f"Bearer {token}"
+        content: bytes | None = None
         try:
-            return await self._client.request(method, path, json=json, params=params, headers=headers)
+            if json is not None:
+                # Models nested in the payload are written straight to JSON bytes by pydantic-core (no dict round-trip).
+                content = to_json(json)
+                headers["Content-Type"] = "application/json"
+            return await self._client.request(method, path, content=content, params=params, headers=headers)
         except Exception as exc:
             raise ArpServerError(
                 code="run_store_unavailable",
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Any, ClassVar
 
 from arp_auth import AuthClient
-from arp_standard_client.errors import ArpApiError
 from arp_standard_client.selection import SelectionClient
+from arp_standard_client.selection.api.candidate_sets import generate_candidate_set
+from arp_standard_client.selection.api.health import health
+from arp_standard_client.selection.api.version import version
 from arp_standard_model import (
     CandidateSet,
     CandidateSetRequest,
@@ -16,13 +17,27 @@ from arp_standard_model import (
     SelectionVersionRequest,
     VersionInfo,
 )
-from arp_standard_server import ArpServerError
 
-from ..auth import client_credentials_token
+from ._gateway import _AsyncSdkClient, _GatewayClient, gateway_httpx_args, unwrap_response
 
-class SelectionGatewayClient:
+
+class AsyncSelectionClient(_AsyncSdkClient):
+    """Async counterpart of `SelectionClient` built on the generated `asyncio_detailed` endpoints."""
+
+    _health_endpoint: ClassVar[Any] = health
+    _version_endpoint: ClassVar[Any] = version
+
+    async def generate_candidate_set(self, request: SelectionGenerateCandidateSetRequest) -> CandidateSet:
+        return unwrap_response(await generate_candidate_set.asyncio_detailed(client=self._client, body=request.body))
+
+
+class SelectionGatewayClient(_GatewayClient):
     """Outgoing Selection Service client wrapper for the Run Coordinator."""
 
+    _failure_code: ClassVar[str] = "selection_service_unavailable"
+    _url_field_name: ClassVar[str] = "selection_service_url"
+    _service_label: ClassVar[str] = "Selection Service"
+
     # Core method - API surface and main extension points
     def __init__(
         self,
@@ -32,64 +47,32 @@ class SelectionGatewayClient:
         audience: str | None = None,
         scope: str | None = None,
         client: SelectionClient | None = None,
-        client_factory: Callable[[Any], SelectionClient] | None = None,
+        client_factory: Callable[[Any], AsyncSelectionClient] | None = None,
     ) -> None:
-        self.base_url = base_url
-        self._client = client or SelectionClient(base_url=base_url)
-        self._auth_client = auth_client
-        self._audience = audience
-        self._scope = scope
-        self._client_factory = client_factory or (lambda raw_client: SelectionClient(client=raw_client))
+        super().__init__(
+            base_url=base_url,
+            auth_client=auth_client,
+            audience=audience,
+            scope=scope,
+            client=client or SelectionClient(base_url=base_url, httpx_args=gateway_httpx_args()),
+            client_factory=client_factory or (lambda raw_client: AsyncSelectionClient(client=raw_client)),
+        )
 
     # Core methods - outgoing Selection calls
     async def generate_candidate_set(self, body: CandidateSetRequest) -> CandidateSet:
         return await self._call(
             "generate_candidate_set",
-            SelectionGenerateCandidateSetRequest(body=body),
+            SelectionGenerateCandidateSetRequest.model_construct(body=body),
         )
 
     async def health(self) -> Health:
         return await self._call(
             "health",
-            SelectionHealthRequest(),
+            SelectionHealthRequest.model_construct(),
         )
 
     async def version(self) -> VersionInfo:
         return await self._call(
             "version",
-            SelectionVersionRequest(),
-        )
-
-    # Helpers (internal): implementation detail for the reference implementation.
-    async def _call(self, method_name: str, request: Any) -> Any:
-        client = await self._client_for()
-        fn: Callable[[Any], Any] = getattr(client, method_name)
-        try:
-            return await asyncio.to_thread(fn, request)
-        except ArpApiError as exc:
-            raise ArpServerError(
-                code=exc.code,
-                message=exc.message,
-                status_code=exc.status_code or 502,
-                details=exc.details,
-            ) from exc
-        except Exception as exc:
-            raise ArpServerError(
-                code="selection_service_unavailable",
-                message="Selection Service request failed",
-                status_code=502,
-                details={
-                    "selection_service_url": self.base_url,
-                    "error": str(exc),
-                },
-            ) from exc
-
-    async def _client_for(self) -> SelectionClient:
-        bearer_token = await client_credentials_token(
-            self._auth_client,
-            audience=self._audience,
-            scope=self._scope,
-            service_label="Selection Service",
+            SelectionVersionRequest.model_construct(),
         )
-        raw_client = self._client.raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
-        return self._client_factory(raw_client)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
 import os
 import uuid
@@ -37,7 +36,6 @@ from arp_standard_model import (
     RunCoordinatorCompleteNodeRunParams,
     RunCoordinatorCompleteNodeRunRequest,
     RunCoordinatorCreateNodeRunsRequest,
-    RunCoordinatorGetRunParams,
     RunCoordinatorGetRunRequest,
     RunCoordinatorGetNodeRunRequest,
     RunCoordinatorHealthRequest,
@@ -69,8 +67,17 @@ from .clients import (
 )
 from .utils import now
 
+try:  # Optional speedup (`orjson` extra); stdlib json is the fallback.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Pre-bound for the per-child loop in `create_node_runs`.
+_uuid4 = uuid.uuid4
+_QUEUED = NodeRunState.queued
+
 
 class RunEventType(StrEnum):
     run_started = "run_started"
@@ -122,8 +129,12 @@ class RunCoordinator(BaseRunCoordinatorServer):
           - Replace internal service clients with your own implementations.
           - Add scheduler/queue integration for NodeRuns.
         """
-        self._service_name = service_name
-        self._service_version = service_version
+        # /v1/version is static for the process lifetime; build it once.
+        self._version_info = VersionInfo.model_construct(
+            service_name=service_name,
+            service_version=service_version,
+            supported_api_versions=["v1"],
+        )
         self._atomic_executor = atomic_executor
         self._composite_executor = composite_executor
         self._selection_service = selection_service
@@ -157,7 +168,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
           - request: RunCoordinatorHealthRequest (unused).
         """
         _ = request
-        return Health(status=Status.ok, time=now())
+        return Health.model_construct(status=Status.ok, time=now())
 
     async def version(self, request: RunCoordinatorVersionRequest) -> VersionInfo:
         """
@@ -167,11 +178,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
           - request: RunCoordinatorVersionRequest (unused).
         """
         _ = request
-        return VersionInfo(
-            service_name=self._service_name,
-            service_version=self._service_version,
-            supported_api_versions=["v1"],
-        )
+        return self._version_info
 
     async def create_node_runs(self, request: RunCoordinatorCreateNodeRunsRequest) -> NodeRunsCreateResponse:
         """
@@ -232,11 +239,13 @@ class RunCoordinator(BaseRunCoordinatorServer):
         # Build pending NodeRuns first; we persist only after constraints pass.
         pending: list[tuple[NodeRun, str | None, Extensions | None, str | None]] = []
         new_count = 0
+        # One timestamp per batch: children created by a single request share `created_at`.
+        created_at = now()
         for spec in body.node_runs:
             node_run_id = (
                 _idempotent_node_run_id(body.run_id, body.parent_node_run_id, spec.idempotency_key)
                 if spec.idempotency_key
-                else f"node_run_{uuid.uuid4().hex}"
+                else f"node_run_{_uuid4().hex}"
             )
             # Idempotent retry: validate and reuse the existing NodeRun.
             if spec.idempotency_key and (existing := await self._run_store.get_node_run(node_run_id)) is not None:
@@ -286,15 +295,15 @@ class RunCoordinator(BaseRunCoordinatorServer):
                 extensions_payload["constraints"] = effective_constraints.model_dump(exclude_none=True)
             extensions = Extensions(**extensions_payload) if extensions_payload else spec.extensions
 
-            # Create new node run
-            node_run = NodeRun(
+            # Create new node run (fields are already validated or coordinator-generated; skip re-validation).
+            node_run = NodeRun.model_construct(
                 node_run_id=node_run_id,
                 run_id=body.run_id,
                 parent_node_run_id=body.parent_node_run_id,
                 node_type_ref=spec.node_type_ref,
                 kind=kind,
-                state=NodeRunState.queued,
-                created_at=now(),
+                state=_QUEUED,
+                created_at=created_at,
                 started_at=None,
                 ended_at=None,
                 inputs=spec.inputs,
@@ -310,25 +319,13 @@ class RunCoordinator(BaseRunCoordinatorServer):
         # Enforce structural constraints before writing new NodeRuns.
         if structural is not None:
             if structural.max_depth is not None and parent_depth + 1 > structural.max_depth:
-                raise ArpServerError(
-                    code="constraint_violation",
-                    message="max_depth constraint violated for child NodeRuns",
-                    status_code=409,
-                )
+                raise _constraint_violation("max_depth constraint violated for child NodeRuns")
             if structural.max_children_per_composite is not None:
                 if len(existing_children) + new_count > structural.max_children_per_composite:
-                    raise ArpServerError(
-                        code="constraint_violation",
-                        message="max_children_per_composite constraint violated",
-                        status_code=409,
-                    )
+                    raise _constraint_violation("max_children_per_composite constraint violated")
             if structural.max_total_nodes_per_run is not None:
                 if total_existing + new_count > structural.max_total_nodes_per_run:
-                    raise ArpServerError(
-                        code="constraint_violation",
-                        message="max_total_nodes_per_run constraint violated",
-                        status_code=409,
-                    )
+                    raise _constraint_violation("max_total_nodes_per_run constraint violated")
 
         if new_count:
             # Record decomposition + bump parent decomposition rounds before child writes.
@@ -343,54 +340,84 @@ class RunCoordinator(BaseRunCoordinatorServer):
             rounds = int(parent_extensions_payload.get("decomposition_rounds") or 0)
             if structural is not None and structural.max_decomposition_rounds_per_node is not None:
                 if rounds + 1 > structural.max_decomposition_rounds_per_node:
-                    raise ArpServerError(
-                        code="constraint_violation",
-                        message="max_decomposition_rounds_per_node constraint violated",
-                        status_code=409,
-                    )
+                    raise _constraint_violation("max_decomposition_rounds_per_node constraint violated")
             parent_extensions_payload["decomposition_rounds"] = rounds + 1
             updated_parent = parent_node_run.model_copy(
                 update={"extensions": Extensions(**parent_extensions_payload)}
             )
             await self._run_store.update_node_run(updated_parent)
 
-        # Persist and emit per-node events after constraints pass.
-        for node_run, candidate_set_id, extensions, idempotency_key in pending:
-            await self._run_store.create_node_run(node_run, idempotency_key=idempotency_key)
+        # Persist new NodeRuns as one concurrent batch after constraints pass.
+        # Every write is awaited; children that did persist still get their events and dispatch before the
+        # first failure is re-raised.
+        results = await asyncio.gather(
+            *(
+                self._run_store.create_node_run(node_run, idempotency_key=idempotency_key)
+                for node_run, _, _, idempotency_key in pending
+            ),
+            return_exceptions=True,
+        )
+        persist_error: BaseException | None = None
+        persisted: list[tuple[NodeRun, str | None, Extensions | None, str | None]] = []
+        for item, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                persist_error = persist_error or result
+            else:
+                persisted.append(item)
+
+        # Emit per-node events (in request order) with a single Event Stream append.
+        # The batch shares the children's `created_at`, formatted once rather than per event.
+        events: list[dict[str, object]] = []
+        event_time = created_at.isoformat()
+        for node_run, candidate_set_id, extensions, _ in persisted:
             created.append(node_run)
-            await self._emit_event(
-                run_id=body.run_id,
-                node_run_id=node_run.node_run_id,
-                event_type=RunEventType.node_run_assigned,
-                data={"parent_node_run_id": body.parent_node_run_id},
+            events.append(
+                _run_event(
+                    run_id=body.run_id,
+                    node_run_id=node_run.node_run_id,
+                    event_type=RunEventType.node_run_assigned,
+                    data={"parent_node_run_id": body.parent_node_run_id},
+                    time=event_time,
+                )
             )
 
             binding_decision = None
             extensions_payload = extensions.model_dump() if extensions is not None else {}
             if "binding_decision" in extensions_payload:
                 binding_decision = extensions_payload["binding_decision"]
-                await self._emit_event(
-                    run_id=body.run_id,
-                    node_run_id=node_run.node_run_id,
-                    event_type=RunEventType.subtask_mapped,
-                    data=binding_decision,
+                events.append(
+                    _run_event(
+                        run_id=body.run_id,
+                        node_run_id=node_run.node_run_id,
+                        event_type=RunEventType.subtask_mapped,
+                        data=binding_decision,
+                        time=event_time,
+                    )
                 )
 
             if candidate_set_id is not None:
-                await self._emit_event(
-                    run_id=body.run_id,
-                    node_run_id=node_run.node_run_id,
-                    event_type=RunEventType.candidate_set_generated,
-                    data={
-                        "candidate_set_id": candidate_set_id,
-                        "subtask_id": binding_decision.get("subtask_id") if isinstance(binding_decision, dict) else None,
-                    },
+                events.append(
+                    _run_event(
+                        run_id=body.run_id,
+                        node_run_id=node_run.node_run_id,
+                        event_type=RunEventType.candidate_set_generated,
+                        data={
+                            "candidate_set_id": candidate_set_id,
+                            "subtask_id": binding_decision.get("subtask_id") if isinstance(binding_decision, dict) else None,
+                        },
+                        time=event_time,
+                    )
                 )
+        if events:
+            await self._emit_events(events)
 
-            # If enabled, dispatch newly created NodeRuns in-process immediately.
-            # A future design can replace this with a durable queue/worker model.
-            if self._auto_dispatch:
+        # If enabled, dispatch newly created NodeRuns in-process immediately.
+        # A future design can replace this with a durable queue/worker model.
+        if self._auto_dispatch:
+            for node_run, _, _, _ in persisted:
                 asyncio.create_task(self._dispatch_node_run(node_run.node_run_id))
+        if persist_error is not None:
+            raise persist_error
         logger.info(
             "Create NodeRuns completed (run_id=%s, created=%s, new=%s)",
             body.run_id,
@@ -423,13 +450,10 @@ class RunCoordinator(BaseRunCoordinatorServer):
         node_run = await self._get_node_run_or_404(request.params.node_run_id)
 
         # Persist evaluation (+ optional recovery hint) onto the NodeRun record.
-        updated = node_run.model_copy(
-            update={
-                "evaluation_result": request.body.evaluation_result,
-                "recovery_actions": [request.body.recovery_action] if request.body.recovery_action else None,
-            }
-        )
-        await self._run_store.update_node_run(updated)
+        # The Run Store client decodes a fresh NodeRun per read, so the record is updated in place (no model_copy).
+        node_run.evaluation_result = request.body.evaluation_result
+        node_run.recovery_actions = [request.body.recovery_action] if request.body.recovery_action else None
+        await self._run_store.update_node_run(node_run)
         status = request.body.evaluation_result.status
         status_value = status.value if hasattr(status, "value") else status
         logger.info(
@@ -441,15 +465,15 @@ class RunCoordinator(BaseRunCoordinatorServer):
 
         # Emit durable events for observability/auditing.
         await self._emit_event(
-            run_id=updated.run_id,
-            node_run_id=updated.node_run_id,
+            run_id=node_run.run_id,
+            node_run_id=node_run.node_run_id,
             event_type=RunEventType.node_evaluated,
             data=request.body.evaluation_result.model_dump(exclude_none=True),
         )
         if request.body.recovery_action is not None:
             await self._emit_event(
-                run_id=updated.run_id,
-                node_run_id=updated.node_run_id,
+                run_id=node_run.run_id,
+                node_run_id=node_run.node_run_id,
                 event_type=RunEventType.recovery_applied,
                 data=request.body.recovery_action.model_dump(exclude_none=True),
             )
@@ -472,54 +496,49 @@ class RunCoordinator(BaseRunCoordinatorServer):
         terminal_state = NodeRunState(body.state)
 
         # Attach completion error details (if present) into extensions for post-mortem debugging.
+        # Extensions is an open model, so model_copy() grafts the key without dumping/re-validating the rest.
         updated_extensions = node_run.extensions
         if body.error is not None:
-            extensions_payload = {}
-            if updated_extensions is not None:
-                extensions_payload = updated_extensions.model_dump()
-            extensions_payload["completion_error"] = body.error.model_dump()
-            updated_extensions = Extensions(**extensions_payload)
+            updated_extensions = (updated_extensions or Extensions()).model_copy(
+                update={"completion_error": body.error.model_dump()}
+            )
 
-        # Persist terminal state + outputs.
-        updated = node_run.model_copy(
-            update={
-                "state": terminal_state,
-                "outputs": body.outputs,
-                "output_artifacts": body.output_artifacts,
-                "ended_at": now(),
-                "extensions": updated_extensions,
-            }
-        )
-        await self._run_store.update_node_run(updated)
-        logger.info("NodeRun completed (node_run_id=%s, state=%s)", updated.node_run_id, updated.state)
+        # Persist terminal state + outputs (in place; see report_node_run_evaluation).
+        node_run.state = terminal_state
+        node_run.outputs = body.outputs
+        node_run.output_artifacts = body.output_artifacts
+        node_run.ended_at = now()
+        node_run.extensions = updated_extensions
+        await self._run_store.update_node_run(node_run)
+        logger.info("NodeRun completed (node_run_id=%s, state=%s)", node_run.node_run_id, node_run.state)
         if body.error is not None:
             logger.warning(
                 "NodeRun error (node_run_id=%s, code=%s)",
-                updated.node_run_id,
+                node_run.node_run_id,
                 body.error.code,
             )
 
         # Emit completion events.
-        if updated.kind == NodeKind.atomic:
+        if node_run.kind == NodeKind.atomic:
             await self._emit_event(
-                run_id=updated.run_id,
-                node_run_id=updated.node_run_id,
+                run_id=node_run.run_id,
+                node_run_id=node_run.node_run_id,
                 event_type=RunEventType.atomic_executed,
-                data={"state": updated.state},
+                data={"state": node_run.state},
             )
 
         # If the root NodeRun completed, transition the Run to a terminal state.
-        if (run := await self._run_store.get_run(updated.run_id)) is not None and updated.node_run_id == run.root_node_run_id:
+        if (run := await self._run_store.get_run(node_run.run_id)) is not None and node_run.node_run_id == run.root_node_run_id:
             run_state = RunState.succeeded
-            if updated.state == NodeRunState.failed:
+            if node_run.state == NodeRunState.failed:
                 run_state = RunState.failed
-            if updated.state == NodeRunState.canceled:
+            if node_run.state == NodeRunState.canceled:
                 run_state = RunState.canceled
             updated_run = run.model_copy(update={"state": run_state, "ended_at": now()})
             await self._run_store.update_run(updated_run)
             await self._emit_event(
-                run_id=updated.run_id,
-                node_run_id=updated.node_run_id,
+                run_id=node_run.run_id,
+                node_run_id=node_run.node_run_id,
                 event_type=RunEventType.run_completed,
                 data={"state": updated_run.state},
             )
@@ -546,7 +565,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
         run_extensions = Extensions(**run_extensions_payload) if run_extensions_payload else request.body.extensions
 
         # Persist the Run record and emit the run_started event.
-        run = Run(
+        run = Run.model_construct(
             run_id=run_id,
             state=RunState.running,
             root_node_run_id=root_node_run_id,
@@ -579,7 +598,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
         if root_constraints is not None:
             root_extensions_payload["constraints"] = root_constraints.model_dump(exclude_none=True)
         root_extensions = Extensions(**root_extensions_payload) if root_extensions_payload else request.body.extensions
-        root_node_run = NodeRun(
+        root_node_run = NodeRun.model_construct(
             node_run_id=root_node_run_id,
             run_id=run_id,
             parent_node_run_id=None,
@@ -646,9 +665,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
         """
         logger.info("Run cancel requested (run_id=%s)", request.params.run_id)
         # Load the Run.
-        run = await self.get_run(
-            RunCoordinatorGetRunRequest(params=RunCoordinatorGetRunParams(run_id=request.params.run_id))
-        )
+        run = await self._get_run_or_404(request.params.run_id)
 
         # If already terminal, treat cancel as idempotent.
         if run.state in {RunState.succeeded, RunState.failed, RunState.canceled}:
@@ -688,15 +705,15 @@ class RunCoordinator(BaseRunCoordinatorServer):
         node_run = await self._get_node_run_or_404(request.params.node_run_id)
         descendant_ids = await self._collect_descendant_ids(node_run)
 
-        # Stream run-level NDJSON, filter by node_run_id ∈ descendants, and re-emit NDJSON.
+        # Stream run-level NDJSON, filter by node_run_id ∈ descendants, and re-emit the matching lines as-is.
         raw = await self._event_stream.stream_run_events(node_run.run_id)
         lines: list[str] = []
         for line in raw.splitlines():
-            if not line.strip():
+            if not (line := line.strip()):
                 continue
-            payload = json.loads(line)
+            payload = _json_loads(line)
             if payload.get("node_run_id") in descendant_ids:
-                lines.append(json.dumps(payload, separators=(",", ":"), ensure_ascii=True))
+                lines.append(line)
         return "\n".join(lines) + ("\n" if lines else "")
 
     async def _dispatch_node_run(self, node_run_id: str) -> None:
@@ -901,11 +918,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
     ) -> Run:
         """Fetch a Run from Run Store or raise a 404-shaped ArpServerError."""
         if (run := await self._run_store.get_run(run_id)) is None:
-            raise ArpServerError(
-                code=code,
-                message=message or f"Run '{run_id}' not found",
-                status_code=404,
-            )
+            raise _not_found(code, message or f"Run '{run_id}' not found")
         return run
 
     async def _get_node_run_or_404(
@@ -917,11 +930,7 @@ class RunCoordinator(BaseRunCoordinatorServer):
     ) -> NodeRun:
         """Fetch a NodeRun from Run Store or raise a 404-shaped ArpServerError."""
         if (node_run := await self._run_store.get_node_run(node_run_id)) is None:
-            raise ArpServerError(
-                code=code,
-                message=message or f"NodeRun '{node_run_id}' not found",
-                status_code=404,
-            )
+            raise _not_found(code, message or f"NodeRun '{node_run_id}' not found")
         return node_run
 
     async def _fail_node_run(
@@ -979,17 +988,14 @@ class RunCoordinator(BaseRunCoordinatorServer):
 
         Note: sequence numbers are assigned by the Event Stream service; coordinator provides the event type + data.
         """
-        event_type_value = event_type.value if hasattr(event_type, "value") else event_type
-        payload: dict[str, object] = {
-            "run_id": run_id,
-            "node_run_id": node_run_id,
-            "type": event_type_value,
-            "time": now().isoformat(),
-        }
-        if data is not None:
-            payload["data"] = data
+        await self._emit_events(
+            [_run_event(run_id=run_id, node_run_id=node_run_id, event_type=event_type, data=data)]
+        )
+
+    async def _emit_events(self, events: list[dict[str, object]]) -> None:
+        """Append a batch of RunEvent payloads to the Event Stream in one request (order is preserved)."""
         try:
-            await self._event_stream.append_events([payload])
+            await self._event_stream.append_events(events)
         except ArpServerError as exc:
             logger.warning(
                 "Event stream append failed (%s): %s",
@@ -1160,6 +1166,31 @@ def _infer_kind(node_type_id: str) -> NodeKind | None:
     return None
 
 
+def _run_event(
+    *,
+    run_id: str,
+    node_run_id: str | None,
+    event_type: RunEventType,
+    data: dict | None,
+    time: str | None = None,
+) -> dict[str, object]:
+    """
+    Build a RunEvent payload for the Event Stream (seq is assigned by the Event Stream service).
+
+    `time` is an ISO-8601 timestamp; batches pass one shared value, otherwise the current time is used.
+    """
+    event_type_value = event_type.value if hasattr(event_type, "value") else event_type
+    payload: dict[str, object] = {
+        "run_id": run_id,
+        "node_run_id": node_run_id,
+        "type": event_type_value,
+        "time": time or now().isoformat(),
+    }
+    if data is not None:
+        payload["data"] = data
+    return payload
+
+
 def _normalize_url(value: str) -> str | None:
     """Normalize a base URL (strip whitespace, remove trailing slash, remove `/v1` suffix)."""
     url = value.strip()
@@ -1319,6 +1350,18 @@ def _idempotent_node_run_id(run_id: str, parent_node_run_id: str, idempotency_ke
     return f"node_run_{digest}"
 
 
+def _not_found(code: str, message: str) -> ArpServerError:
+    return ArpServerError(code=code, message=message, status_code=404)
+
+
+def _constraint_violation(message: str) -> ArpServerError:
+    return ArpServerError(code="constraint_violation", message=message, status_code=409)
+
+
+def _idempotency_conflict(message: str) -> ArpServerError:
+    return ArpServerError(code="idempotency_conflict", message=message, status_code=409)
+
+
 def _assert_idempotent_match(
     existing: NodeRun,
     *,
@@ -1328,23 +1371,11 @@ def _assert_idempotent_match(
     expected_constraints: ConstraintEnvelope | None,
 ) -> None:
     if existing.run_id != run_id or existing.parent_node_run_id != parent_node_run_id:
-        raise ArpServerError(
-            code="idempotency_conflict",
-            message="Idempotency key already used for a different parent/run",
-            status_code=409,
-        )
+        raise _idempotency_conflict("Idempotency key already used for a different parent/run")
     if existing.node_type_ref != spec.node_type_ref:
-        raise ArpServerError(
-            code="idempotency_conflict",
-            message="Idempotency key already used for a different NodeTypeRef",
-            status_code=409,
-        )
+        raise _idempotency_conflict("Idempotency key already used for a different NodeTypeRef")
     if existing.inputs != spec.inputs:
-        raise ArpServerError(
-            code="idempotency_conflict",
-            message="Idempotency key already used for different inputs",
-            status_code=409,
-        )
+        raise _idempotency_conflict("Idempotency key already used for different inputs")
     expected_extensions: dict[str, object] = {}
     if spec.binding_decision is not None:
         expected_extensions["binding_decision"] = spec.binding_decision.model_dump(exclude_none=True)
@@ -1355,8 +1386,4 @@ def _assert_idempotent_match(
     existing_extensions = existing.extensions.model_dump() if existing.extensions else {}
     for key, value in expected_extensions.items():
         if existing_extensions.get(key) != value:
-            raise ArpServerError(
-                code="idempotency_conflict",
-                message=f"Idempotency key already used with different {key}",
-                status_code=409,
-            )
+            raise _idempotency_conflict(f"Idempotency key already used with different {key}")
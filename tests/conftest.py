@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+
+import pytest
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@pytest.fixture(scope="session")
+def runner() -> Iterator[asyncio.Runner]:
+    """Session-wide event loop (uvloop when the extra is installed), reused instead of one loop per asyncio.run()."""
+    with asyncio.Runner(loop_factory=_loop_factory()) as session_runner:
+        yield session_runner
@@ -1,5 +1,7 @@
 import asyncio
 import os
+import threading
+import time
 from types import SimpleNamespace
 from typing import cast
 
@@ -69,6 +71,27 @@ def test_client_credentials_token_success() -> None:
     assert token == "token-123"
 
 
+def test_client_credentials_token_runs_on_dedicated_pool() -> None:
+    threads: list[str] = []
+
+    class DummyAuthClient:
+        def client_credentials(self, *, audience, scope):
+            _ = audience
+            _ = scope
+            threads.append(threading.current_thread().name)
+            return SimpleNamespace(access_token="token-123")
+
+    asyncio.run(
+        client_credentials_token(
+            cast(AuthClient, DummyAuthClient()),
+            audience="aud",
+            scope=None,
+            service_label="Test",
+        )
+    )
+    assert threads[0].startswith("arp-auth-token")
+
+
 def test_client_credentials_token_error() -> None:
     class DummyError(Exception):
         status_code = 401
@@ -95,3 +118,30 @@ def test_normalize_base_url() -> None:
     assert normalize_base_url("http://example.com/") == "http://example.com"
     assert normalize_base_url("http://example.com/v1") == "http://example.com"
     assert normalize_base_url("http://example.com/v1/") == "http://example.com"
+
+
+def test_client_credentials_token_coalesces_concurrent_requests() -> None:
+    calls: list[tuple[str | None, str | None]] = []
+
+    class DummyAuthClient:
+        def client_credentials(self, *, audience, scope):
+            calls.append((audience, scope))
+            time.sleep(0.05)
+            return SimpleNamespace(access_token=f"token-{len(calls)}")
+
+    auth_client = cast(AuthClient, DummyAuthClient())
+
+    async def _scenario():
+        return await asyncio.gather(
+            *(
+                client_credentials_token(auth_client, audience="aud", scope=None, service_label="Test")
+                for _ in range(5)
+            )
+        )
+
+    assert asyncio.run(_scenario()) == ["token-1"] * 5
+    assert calls == [("aud", None)]
+
+    # Once the shared request finishes, the next call fetches a fresh token.
+    token = asyncio.run(client_credentials_token(auth_client, audience="aud", scope=None, service_label="Test"))
+    assert token == "token-2"
@@ -1,6 +1,8 @@
 import asyncio
 import json
 import os
+from collections import deque
+from dataclasses import dataclass
 
 import pytest
 
@@ -45,16 +47,47 @@ from arp_standard_model import (
     Status,
 )
 from arp_standard_server import ArpServerError
+from pydantic_core import to_json
 from jarvis_run_coordinator.coordinator import RunCoordinator
 
 os.environ.setdefault("JARVIS_RUN_COORDINATOR_AUTO_DISPATCH", "false")
 os.environ.setdefault("JARVIS_POLICY_PROFILE", "dev-allow")
 
+try:  # Same optional `orjson` extra the coordinator uses; stdlib json is the fallback.
+    from orjson import dumps as _json_dumps
+except ImportError:
+
+    def _json_dumps(obj: object, /) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode()
+
+
+# Shared refs, validated once at import (pydantic models are not mutated by the coordinator).
+_ATOMIC_ECHO_REF = NodeTypeRef(node_type_id="atomic.echo", version="0.1.0")
+_COMPOSITE_ECHO_REF = NodeTypeRef(node_type_id="composite.echo", version="0.1.0")
+
+
+@dataclass(slots=True)
+class _NodeRunRow:
+    """Compact stored NodeRun: the keys the store filters on plus the encoded record."""
+
+    node_run_id: str
+    run_id: str
+    payload: bytes
+
+    @classmethod
+    def from_model(cls, node_run: NodeRun) -> "_NodeRunRow":
+        return cls(node_run.node_run_id, node_run.run_id, to_json(node_run))
+
+    def to_model(self) -> NodeRun:
+        # Each read decodes a fresh NodeRun, like the HTTP Run Store client does.
+        return NodeRun.model_validate_json(self.payload)
+
 
 class InMemoryRunStore:
     def __init__(self) -> None:
         self._runs: dict[str, Run] = {}
-        self._node_runs: dict[str, NodeRun] = {}
+        self._node_runs: dict[str, _NodeRunRow] = {}
+        self._node_run_ids_by_run: dict[str, list[str]] = {}
         self._run_idempotency: dict[str, str] = {}
         self._node_run_idempotency: dict[str, str] = {}
 
@@ -95,55 +128,74 @@ class InMemoryRunStore:
                         message="Idempotency key already used for a different node_run_id.",
                         status_code=409,
                     )
-                return existing
+                return existing.to_model()
         if node_run.node_run_id in self._node_runs:
             raise ArpServerError(
                 code="node_run_already_exists",
                 message="NodeRun already exists.",
                 status_code=409,
             )
-        self._node_runs[node_run.node_run_id] = node_run
+        self._node_runs[node_run.node_run_id] = _NodeRunRow.from_model(node_run)
+        self._node_run_ids_by_run.setdefault(node_run.run_id, []).append(node_run.node_run_id)
         if idempotency_key:
             self._node_run_idempotency[idempotency_key] = node_run.node_run_id
         return node_run
 
     async def get_node_run(self, node_run_id: str) -> NodeRun | None:
-        return self._node_runs.get(node_run_id)
+        if (row := self._node_runs.get(node_run_id)) is None:
+            return None
+        return row.to_model()
 
     async def update_node_run(self, node_run: NodeRun) -> NodeRun:
         if node_run.node_run_id not in self._node_runs:
             raise ArpServerError(code="node_run_not_found", message="NodeRun not found.", status_code=404)
-        self._node_runs[node_run.node_run_id] = node_run
+        self._node_runs[node_run.node_run_id] = _NodeRunRow.from_model(node_run)
         return node_run
 
     async def list_node_runs_for_run(self, run_id: str, *, limit: int = 500) -> list[NodeRun]:
+        # `limit` is a page size for the HTTP client, which follows next_token to the end; return every NodeRun.
         _ = limit
-        return [node_run for node_run in self._node_runs.values() if node_run.run_id == run_id]
+        return [self._node_runs[node_run_id].to_model() for node_run_id in self._node_run_ids_by_run.get(run_id, ())]
 
 
 class InMemoryEventStream:
     def __init__(self) -> None:
-        self._events: dict[str, list[dict[str, object]]] = {}
+        # Per-run append-only logs: appends and in-order iteration only, so a deque avoids list resizes.
+        self._events: dict[str, deque[dict[str, object]]] = {}
+        # NDJSON body per run, encoded once on append so repeated streams skip re-encoding.
+        self._snapshots: dict[str, bytearray] = {}
         self._next_seq: dict[str, int] = {}
 
     async def append_events(self, events):
-        items = []
-        for event in events:
-            run_id = event["run_id"]
-            seq = event.get("seq")
-            if not isinstance(seq, int):
-                seq = self._next_seq.get(run_id, 1)
-                self._next_seq[run_id] = seq + 1
-            event_payload = dict(event)
-            event_payload["seq"] = seq
-            self._events.setdefault(run_id, []).append(event_payload)
-            items.append({"run_id": run_id, "seq": seq})
-        return {"items": items, "next_seq_by_run": self._next_seq.copy()}
+        # Bucket by run once (remembering each event's position), then extend each run's log and snapshot in one step.
+        buckets: dict[str, list[tuple[int, dict[str, object]]]] = {}
+        for index, event in enumerate(events):
+            buckets.setdefault(event["run_id"], []).append((index, event))
+        items: list[dict[str, object] | None] = [None] * len(events)
+        for run_id, bucket in buckets.items():
+            next_seq = self._next_seq.get(run_id, 1)
+            stored = []
+            for index, event in bucket:
+                seq = event.get("seq")
+                if not isinstance(seq, int):
+                    seq = next_seq
+                    next_seq += 1
+                stored.append({**event, "seq": seq})
+                items[index] = {"run_id": run_id, "seq": seq}
+            self._next_seq[run_id] = next_seq
+            if (log := self._events.get(run_id)) is None:
+                log = self._events[run_id] = deque()
+            log.extend(stored)
+            if (snapshot := self._snapshots.get(run_id)) is None:
+                snapshot = self._snapshots[run_id] = bytearray()
+            snapshot += b"\n".join(map(_json_dumps, stored))
+            snapshot += b"\n"
+        # Report seqs only for the runs touched by this batch; copying every run's seq grows with run count.
+        return {"items": items, "next_seq_by_run": {run_id: self._next_seq[run_id] for run_id in buckets}}
 
     async def stream_run_events(self, run_id):
-        events = self._events.get(run_id, [])
-        lines = [json.dumps(event, separators=(",", ":"), ensure_ascii=True) for event in events]
-        return "\n".join(lines) + ("\n" if lines else "")
+        # The Event Stream protocol returns str, so the snapshot is decoded (not re-encoded) per call.
+        return self._snapshots.get(run_id, b"").decode()
 
 
 class DummyArtifactStore:
@@ -157,32 +209,44 @@ class DummyArtifactStore:
         return {}
 
 
-def test_create_node_runs_requires_run() -> None:
+def _node_type_ref(node_type_id: str, version: str) -> NodeTypeRef:
+    # Trusted literals: build without validation (other tests keep the validating constructors).
+    return NodeTypeRef.model_construct(node_type_id=node_type_id, version=version)
+
+
+def _create_node_runs_request(
+    run_id: str,
+    parent_node_run_id: str,
+    node_runs: list[NodeRunCreateSpec],
+) -> RunCoordinatorCreateNodeRunsRequest:
+    return RunCoordinatorCreateNodeRunsRequest.model_construct(
+        body=NodeRunsCreateRequest.model_construct(
+            run_id=run_id,
+            parent_node_run_id=parent_node_run_id,
+            node_runs=node_runs,
+        )
+    )
+
+
+def _echo_spec(inputs: dict[str, object]) -> NodeRunCreateSpec:
+    return NodeRunCreateSpec.model_construct(node_type_ref=_node_type_ref("jarvis.core.echo", "0.3.8"), inputs=inputs)
+
+
+def test_create_node_runs_requires_run(runner: asyncio.Runner) -> None:
     coordinator = RunCoordinator(
         run_store=InMemoryRunStore(),
         event_stream=InMemoryEventStream(),
         artifact_store=DummyArtifactStore(),
     )
-    request = RunCoordinatorCreateNodeRunsRequest(
-        body=NodeRunsCreateRequest(
-            run_id="missing_run",
-            parent_node_run_id="root_node_run",
-            node_runs=[
-                NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="jarvis.core.echo", version="0.3.8"),
-                    inputs={"ping": "pong"},
-                )
-            ],
-        )
-    )
+    request = _create_node_runs_request("missing_run", "root_node_run", [_echo_spec({"ping": "pong"})])
 
     with pytest.raises(ArpServerError) as exc:
-        asyncio.run(coordinator.create_node_runs(request))
+        runner.run(coordinator.create_node_runs(request))
 
     assert exc.value.code == "run_not_found"
 
 
-def test_complete_node_run_persists_error_in_extensions() -> None:
+def test_complete_node_run_persists_error_in_extensions(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -192,43 +256,66 @@ def test_complete_node_run_persists_error_in_extensions() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_1",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
 
-    create_request = RunCoordinatorCreateNodeRunsRequest(
-        body=NodeRunsCreateRequest(
-            run_id=run.run_id,
-            parent_node_run_id=run.root_node_run_id,
-            node_runs=[
-                NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="jarvis.core.echo", version="0.3.8"),
-                    inputs={"ping": "pong"},
-                )
-            ],
+    async def _scenario():
+        run = await coordinator.start_run(start_request)
+        create_request = _create_node_runs_request(run.run_id, run.root_node_run_id, [_echo_spec({"ping": "pong"})])
+        response = await coordinator.create_node_runs(create_request)
+        node_run_id = response.node_runs[0].node_run_id
+        complete_request = RunCoordinatorCompleteNodeRunRequest(
+            params=RunCoordinatorCompleteNodeRunParams(node_run_id=node_run_id),
+            body=NodeRunCompleteRequest(
+                state=NodeRunTerminalState.failed,
+                error=Error(code="boom", message="failure"),
+            ),
         )
-    )
-    response = asyncio.run(coordinator.create_node_runs(create_request))
-    node_run_id = response.node_runs[0].node_run_id
+        await coordinator.complete_node_run(complete_request)
+        return await run_store.get_node_run(node_run_id)
+
+    node_run = runner.run(_scenario())
+    assert node_run is not None
+    assert node_run.extensions is not None
+    assert node_run.extensions.model_dump()["completion_error"]["code"] == "boom"
 
+
+def test_complete_node_run_keeps_existing_extensions(runner: asyncio.Runner) -> None:
+    run_store = InMemoryRunStore()
+    coordinator = RunCoordinator(
+        run_store=run_store,
+        event_stream=InMemoryEventStream(),
+        artifact_store=DummyArtifactStore(),
+    )
+    start_request = RunCoordinatorStartRunRequest(
+        body=RunStartRequest(
+            run_id="run_keep_extensions",
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
+            input={"prompt": "test"},
+            constraints=ConstraintEnvelope(structural=Structural(max_depth=2)),
+        )
+    )
+    run = runner.run(coordinator.start_run(start_request))
     complete_request = RunCoordinatorCompleteNodeRunRequest(
-        params=RunCoordinatorCompleteNodeRunParams(node_run_id=node_run_id),
+        params=RunCoordinatorCompleteNodeRunParams(node_run_id=run.root_node_run_id),
         body=NodeRunCompleteRequest(
             state=NodeRunTerminalState.failed,
             error=Error(code="boom", message="failure"),
         ),
     )
-    asyncio.run(coordinator.complete_node_run(complete_request))
+    runner.run(coordinator.complete_node_run(complete_request))
 
-    node_run = asyncio.run(run_store.get_node_run(node_run_id))
-    assert node_run is not None
-    assert node_run.extensions is not None
-    assert node_run.extensions.model_dump()["completion_error"]["code"] == "boom"
+    root = runner.run(run_store.get_node_run(run.root_node_run_id))
+    assert root is not None
+    assert root.extensions is not None
+    extensions = root.extensions.model_dump()
+    assert extensions["completion_error"]["code"] == "boom"
+    assert extensions["constraints"]["structural"]["max_depth"] == 2
 
 
-def test_start_run_persists_constraints_on_run_and_root() -> None:
+def test_start_run_persists_constraints_on_run_and_root(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -239,24 +326,60 @@ def test_start_run_persists_constraints_on_run_and_root() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_constraints",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
             constraints=constraints,
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
-    stored_run = asyncio.run(run_store.get_run(run.run_id))
+    run = runner.run(coordinator.start_run(start_request))
+    stored_run = runner.run(run_store.get_run(run.run_id))
     assert stored_run is not None
     assert stored_run.extensions is not None
     assert stored_run.extensions.model_dump()["constraints"]["structural"]["max_depth"] == 1
 
-    root_node = asyncio.run(run_store.get_node_run(run.root_node_run_id))
+    root_node = runner.run(run_store.get_node_run(run.root_node_run_id))
     assert root_node is not None
     assert root_node.extensions is not None
     assert root_node.extensions.model_dump()["constraints"]["structural"]["max_depth"] == 1
 
 
-def test_create_node_runs_enforces_max_depth() -> None:
+def test_constructed_models_round_trip_validation(runner: asyncio.Runner) -> None:
+    run_store = InMemoryRunStore()
+    coordinator = RunCoordinator(
+        run_store=run_store,
+        event_stream=InMemoryEventStream(),
+        artifact_store=DummyArtifactStore(),
+    )
+    start_request = RunCoordinatorStartRunRequest(
+        body=RunStartRequest(
+            run_id="run_round_trip",
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
+            input={"prompt": "test"},
+        )
+    )
+    run = runner.run(coordinator.start_run(start_request))
+    create_request = RunCoordinatorCreateNodeRunsRequest(
+        body=NodeRunsCreateRequest(
+            run_id=run.run_id,
+            parent_node_run_id=run.root_node_run_id,
+            node_runs=[
+                NodeRunCreateSpec(
+                    node_type_ref=_ATOMIC_ECHO_REF,
+                    inputs={"ping": "pong"},
+                )
+            ],
+        )
+    )
+    response = runner.run(coordinator.create_node_runs(create_request))
+
+    assert Run.model_validate(run.model_dump(mode="json")) == run
+    for row in run_store._node_runs.values():
+        node_run = row.to_model()
+        assert NodeRun.model_validate(node_run.model_dump(mode="json")) == node_run
+    assert response.node_runs[0].state == NodeRunState.queued
+
+
+def test_create_node_runs_enforces_max_depth(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -267,30 +390,30 @@ def test_create_node_runs_enforces_max_depth() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_depth",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
             constraints=constraints,
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
     create_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
             run_id=run.run_id,
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                 )
             ],
         )
     )
     with pytest.raises(ArpServerError) as exc:
-        asyncio.run(coordinator.create_node_runs(create_request))
+        runner.run(coordinator.create_node_runs(create_request))
     assert exc.value.code == "constraint_violation"
 
 
-def test_create_node_runs_enforces_max_children() -> None:
+def test_create_node_runs_enforces_max_children(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -301,34 +424,34 @@ def test_create_node_runs_enforces_max_children() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_children",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
             constraints=constraints,
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
     create_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
             run_id=run.run_id,
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "one"},
                 ),
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "two"},
                 ),
             ],
         )
     )
     with pytest.raises(ArpServerError) as exc:
-        asyncio.run(coordinator.create_node_runs(create_request))
+        runner.run(coordinator.create_node_runs(create_request))
     assert exc.value.code == "constraint_violation"
 
 
-def test_create_node_runs_idempotent() -> None:
+def test_create_node_runs_idempotent(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     event_stream = InMemoryEventStream()
     coordinator = RunCoordinator(
@@ -339,26 +462,26 @@ def test_create_node_runs_idempotent() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_idem",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
     create_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
             run_id=run.run_id,
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                     idempotency_key="step-1",
                 )
             ],
         )
     )
-    response_first = asyncio.run(coordinator.create_node_runs(create_request))
-    response_second = asyncio.run(coordinator.create_node_runs(create_request))
+    response_first = runner.run(coordinator.create_node_runs(create_request))
+    response_second = runner.run(coordinator.create_node_runs(create_request))
     assert response_first.node_runs[0].node_run_id == response_second.node_runs[0].node_run_id
 
     events = event_stream._events.get(run.run_id, [])
@@ -366,7 +489,7 @@ def test_create_node_runs_idempotent() -> None:
     assert len(composite_events) == 1
 
 
-def test_create_node_runs_idempotency_conflict() -> None:
+def test_create_node_runs_idempotency_conflict(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -376,25 +499,25 @@ def test_create_node_runs_idempotency_conflict() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_idem_conflict",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
     create_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
             run_id=run.run_id,
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                     idempotency_key="step-1",
                 )
             ],
         )
     )
-    asyncio.run(coordinator.create_node_runs(create_request))
+    runner.run(coordinator.create_node_runs(create_request))
 
     conflict_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
@@ -402,7 +525,7 @@ def test_create_node_runs_idempotency_conflict() -> None:
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "different"},
                     idempotency_key="step-1",
                 )
@@ -410,11 +533,11 @@ def test_create_node_runs_idempotency_conflict() -> None:
         )
     )
     with pytest.raises(ArpServerError) as exc:
-        asyncio.run(coordinator.create_node_runs(conflict_request))
+        runner.run(coordinator.create_node_runs(conflict_request))
     assert exc.value.code == "idempotency_conflict"
 
 
-def test_dispatch_enforces_candidate_allowlist() -> None:
+def test_dispatch_enforces_candidate_allowlist(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -427,19 +550,19 @@ def test_dispatch_enforces_candidate_allowlist() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_candidates",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
             constraints=constraints,
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
-    asyncio.run(coordinator._dispatch_node_run(run.root_node_run_id))
-    root_node = asyncio.run(run_store.get_node_run(run.root_node_run_id))
+    run = runner.run(coordinator.start_run(start_request))
+    runner.run(coordinator._dispatch_node_run(run.root_node_run_id))
+    root_node = runner.run(run_store.get_node_run(run.root_node_run_id))
     assert root_node is not None
     assert root_node.state == NodeRunState.failed
 
 
-def test_create_node_runs_parent_mismatch() -> None:
+def test_create_node_runs_parent_mismatch(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -448,17 +571,17 @@ def test_create_node_runs_parent_mismatch() -> None:
     )
     run_a = Run(run_id="run_a", root_node_run_id="root_a", state=RunState.running)
     run_b = Run(run_id="run_b", root_node_run_id="root_b", state=RunState.running)
-    asyncio.run(run_store.create_run(run_a))
-    asyncio.run(run_store.create_run(run_b))
+    runner.run(run_store.create_run(run_a))
+    runner.run(run_store.create_run(run_b))
     root = NodeRun(
         node_run_id="root_a",
         run_id="run_a",
         parent_node_run_id=None,
-        node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+        node_type_ref=_COMPOSITE_ECHO_REF,
         state=NodeRunState.queued,
         kind=NodeKind.composite,
     )
-    asyncio.run(run_store.create_node_run(root))
+    runner.run(run_store.create_node_run(root))
 
     request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
@@ -466,18 +589,18 @@ def test_create_node_runs_parent_mismatch() -> None:
             parent_node_run_id="root_a",
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                 )
             ],
         )
     )
     with pytest.raises(ArpServerError) as excinfo:
-        asyncio.run(coordinator.create_node_runs(request))
+        runner.run(coordinator.create_node_runs(request))
     assert excinfo.value.code == "parent_node_run_mismatch"
 
 
-def test_create_node_runs_parent_not_composite() -> None:
+def test_create_node_runs_parent_not_composite(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -485,16 +608,16 @@ def test_create_node_runs_parent_not_composite() -> None:
         artifact_store=DummyArtifactStore(),
     )
     run = Run(run_id="run_parent", root_node_run_id="parent", state=RunState.running)
-    asyncio.run(run_store.create_run(run))
+    runner.run(run_store.create_run(run))
     parent = NodeRun(
         node_run_id="parent",
         run_id=run.run_id,
         parent_node_run_id=None,
-        node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+        node_type_ref=_ATOMIC_ECHO_REF,
         state=NodeRunState.queued,
         kind=NodeKind.atomic,
     )
-    asyncio.run(run_store.create_node_run(parent))
+    runner.run(run_store.create_node_run(parent))
 
     request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
@@ -502,18 +625,18 @@ def test_create_node_runs_parent_not_composite() -> None:
             parent_node_run_id="parent",
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                 )
             ],
         )
     )
     with pytest.raises(ArpServerError) as excinfo:
-        asyncio.run(coordinator.create_node_runs(request))
+        runner.run(coordinator.create_node_runs(request))
     assert excinfo.value.code == "parent_node_run_invalid"
 
 
-def test_create_node_runs_records_binding_decision() -> None:
+def test_create_node_runs_records_binding_decision(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -523,15 +646,15 @@ def test_create_node_runs_records_binding_decision() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_binding",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
 
     binding_decision = BindingDecision(
         subtask_id="subtask-1",
-        chosen_node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+        chosen_node_type_ref=_ATOMIC_ECHO_REF,
         candidate_set_id="set-1",
     )
     create_request = RunCoordinatorCreateNodeRunsRequest(
@@ -540,20 +663,184 @@ def test_create_node_runs_records_binding_decision() -> None:
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                     binding_decision=binding_decision,
                 )
             ],
         )
     )
-    response = asyncio.run(coordinator.create_node_runs(create_request))
+    response = runner.run(coordinator.create_node_runs(create_request))
     node_run = response.node_runs[0]
     assert node_run.extensions is not None
     assert node_run.extensions.model_dump()["candidate_set_id"] == "set-1"
 
 
-def test_create_node_runs_enforces_max_total_nodes() -> None:
+def test_create_node_runs_appends_child_events_in_one_batch(runner: asyncio.Runner) -> None:
+    run_store = InMemoryRunStore()
+    event_stream = InMemoryEventStream()
+    coordinator = RunCoordinator(
+        run_store=run_store,
+        event_stream=event_stream,
+        artifact_store=DummyArtifactStore(),
+    )
+    start_request = RunCoordinatorStartRunRequest(
+        body=RunStartRequest(
+            run_id="run_batch",
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
+            input={"prompt": "test"},
+        )
+    )
+    run = runner.run(coordinator.start_run(start_request))
+
+    batches: list[list[dict[str, object]]] = []
+    append_events = event_stream.append_events
+
+    async def recording_append(events):
+        batches.append(list(events))
+        return await append_events(events)
+
+    event_stream.append_events = recording_append
+    create_request = RunCoordinatorCreateNodeRunsRequest(
+        body=NodeRunsCreateRequest(
+            run_id=run.run_id,
+            parent_node_run_id=run.root_node_run_id,
+            node_runs=[
+                NodeRunCreateSpec(
+                    node_type_ref=_ATOMIC_ECHO_REF,
+                    inputs={"ping": str(index)},
+                )
+                for index in range(3)
+            ],
+        )
+    )
+    response = runner.run(coordinator.create_node_runs(create_request))
+
+    created_ids = [node_run.node_run_id for node_run in response.node_runs]
+    assert all(node_run_id in run_store._node_runs for node_run_id in created_ids)
+    assert [event["type"] for event in batches[0]] == ["composite_decomposed"]
+    assert len(batches) == 2
+    assert [event["node_run_id"] for event in batches[1]] == created_ids
+    assert {event["type"] for event in batches[1]} == {"node_run_assigned"}
+    assert len({node_run.created_at for node_run in response.node_runs}) == 1
+    created_at = response.node_runs[0].created_at
+    assert created_at is not None
+    assert {event["time"] for event in batches[1]} == {created_at.isoformat()}
+    assert len(set(created_ids)) == 3
+
+
+@pytest.mark.parametrize("n", [1, 10, 100])
+def test_create_node_runs_concurrent_requests(runner: asyncio.Runner, n: int) -> None:
+    run_store = InMemoryRunStore()
+    event_stream = InMemoryEventStream()
+    coordinator = RunCoordinator(
+        run_store=run_store,
+        event_stream=event_stream,
+        artifact_store=DummyArtifactStore(),
+    )
+    start_request = RunCoordinatorStartRunRequest(
+        body=RunStartRequest(
+            run_id="run_concurrent",
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
+            input={"prompt": "test"},
+        )
+    )
+    run = runner.run(coordinator.start_run(start_request))
+    requests = [
+        _create_node_runs_request(run.run_id, run.root_node_run_id, [_echo_spec({"ping": str(index)})])
+        for index in range(n)
+    ]
+
+    async def create_all():
+        return await asyncio.gather(*(coordinator.create_node_runs(request) for request in requests))
+
+    responses = runner.run(create_all())
+
+    created_ids = {node_run.node_run_id for response in responses for node_run in response.node_runs}
+    assert len(created_ids) == n
+    listed = runner.run(run_store.list_node_runs_for_run(run.run_id))
+    assert created_ids <= {node_run.node_run_id for node_run in listed}
+    children = [node_run for node_run in listed if node_run.node_run_id in created_ids]
+    assert all(node_run.parent_node_run_id == run.root_node_run_id for node_run in children)
+    seqs = [event["seq"] for event in event_stream._events[run.run_id]]
+    assert seqs == list(range(1, len(seqs) + 1))
+
+
+def test_create_node_runs_partial_persist_failure_emits_and_dispatches_persisted(runner: asyncio.Runner) -> None:
+    class FailingSecondChildStore(InMemoryRunStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.child_writes = 0
+
+        async def create_node_run(self, node_run: NodeRun, *, idempotency_key: str | None = None) -> NodeRun:
+            if node_run.parent_node_run_id is not None:
+                self.child_writes += 1
+                if self.child_writes == 2:
+                    raise ArpServerError(code="run_store_unavailable", message="Run Store down.", status_code=502)
+            return await super().create_node_run(node_run, idempotency_key=idempotency_key)
+
+    run_store = FailingSecondChildStore()
+    event_stream = InMemoryEventStream()
+    coordinator = RunCoordinator(
+        run_store=run_store,
+        event_stream=event_stream,
+        artifact_store=DummyArtifactStore(),
+    )
+    start_request = RunCoordinatorStartRunRequest(
+        body=RunStartRequest(
+            run_id="run_partial",
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
+            input={"prompt": "test"},
+        )
+    )
+    run = runner.run(coordinator.start_run(start_request))
+    dispatched: list[str] = []
+
+    def record_dispatch(node_run_id: str):
+        dispatched.append(node_run_id)
+        return asyncio.sleep(0)
+
+    coordinator._auto_dispatch = True
+    coordinator._dispatch_node_run = record_dispatch
+    request = _create_node_runs_request(
+        run.run_id,
+        run.root_node_run_id,
+        [_echo_spec({"ping": str(index)}) for index in range(3)],
+    )
+
+    with pytest.raises(ArpServerError) as excinfo:
+        runner.run(coordinator.create_node_runs(request))
+
+    assert excinfo.value.code == "run_store_unavailable"
+    persisted_ids = [
+        row.node_run_id for row in run_store._node_runs.values() if row.node_run_id != run.root_node_run_id
+    ]
+    assert len(persisted_ids) == 2
+    assigned = [
+        event["node_run_id"]
+        for event in event_stream._events[run.run_id]
+        if event["type"] == "node_run_assigned" and event["node_run_id"] != run.root_node_run_id
+    ]
+    assert assigned == persisted_ids
+    assert dispatched == persisted_ids
+
+
+def test_in_memory_event_stream_items_follow_input_order(runner: asyncio.Runner) -> None:
+    event_stream = InMemoryEventStream()
+    events = [{"run_id": "run_a"}, {"run_id": "run_b"}, {"run_id": "run_a", "seq": 7}, {"run_id": "run_a"}]
+
+    result = runner.run(event_stream.append_events(events))
+
+    assert result["items"] == [
+        {"run_id": "run_a", "seq": 1},
+        {"run_id": "run_b", "seq": 1},
+        {"run_id": "run_a", "seq": 7},
+        {"run_id": "run_a", "seq": 2},
+    ]
+    assert result["next_seq_by_run"] == {"run_a": 3, "run_b": 2}
+
+
+def test_create_node_runs_enforces_max_total_nodes(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -564,42 +851,44 @@ def test_create_node_runs_enforces_max_total_nodes() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_total",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
             constraints=constraints,
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
     create_request = RunCoordinatorCreateNodeRunsRequest(
         body=NodeRunsCreateRequest(
             run_id=run.run_id,
             parent_node_run_id=run.root_node_run_id,
             node_runs=[
                 NodeRunCreateSpec(
-                    node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+                    node_type_ref=_ATOMIC_ECHO_REF,
                     inputs={"ping": "pong"},
                 )
             ],
         )
     )
     with pytest.raises(ArpServerError) as excinfo:
-        asyncio.run(coordinator.create_node_runs(create_request))
+        runner.run(coordinator.create_node_runs(create_request))
     assert excinfo.value.code == "constraint_violation"
 
 
-def test_health_and_version() -> None:
+def test_health_and_version(runner: asyncio.Runner) -> None:
     coordinator = RunCoordinator(
         run_store=InMemoryRunStore(),
         event_stream=InMemoryEventStream(),
         artifact_store=DummyArtifactStore(),
     )
-    health = asyncio.run(coordinator.health(RunCoordinatorHealthRequest()))
-    version = asyncio.run(coordinator.version(RunCoordinatorVersionRequest()))
+    health = runner.run(coordinator.health(RunCoordinatorHealthRequest()))
+    version = runner.run(coordinator.version(RunCoordinatorVersionRequest()))
     assert health.status == Status.ok
     assert version.service_name == "arp-jarvis-run-coordinator"
+    assert version.supported_api_versions == ["v1"]
+    assert runner.run(coordinator.version(RunCoordinatorVersionRequest())) is version
 
 
-def test_get_run_and_cancel_run() -> None:
+def test_get_run_and_cancel_run(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     event_stream = InMemoryEventStream()
     coordinator = RunCoordinator(
@@ -610,13 +899,13 @@ def test_get_run_and_cancel_run() -> None:
     start_request = RunCoordinatorStartRunRequest(
         body=RunStartRequest(
             run_id="run_2",
-            root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+            root_node_type_ref=_COMPOSITE_ECHO_REF,
             input={"prompt": "test"},
         )
     )
-    run = asyncio.run(coordinator.start_run(start_request))
+    run = runner.run(coordinator.start_run(start_request))
 
-    fetched = asyncio.run(
+    fetched = runner.run(
         coordinator.get_run(
             RunCoordinatorGetRunRequest(
                 params=RunCoordinatorGetRunParams(run_id=run.run_id)
@@ -625,7 +914,7 @@ def test_get_run_and_cancel_run() -> None:
     )
     assert fetched.run_id == run.run_id
 
-    canceled = asyncio.run(
+    canceled = runner.run(
         coordinator.cancel_run(
             RunCoordinatorCancelRunRequest(
                 params=RunCoordinatorCancelRunParams(run_id=run.run_id)
@@ -636,7 +925,7 @@ def test_get_run_and_cancel_run() -> None:
     assert event_stream._events[run.run_id][-1]["type"] == "run_completed"
 
 
-def test_cancel_run_idempotent() -> None:
+def test_cancel_run_idempotent(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     coordinator = RunCoordinator(
         run_store=run_store,
@@ -644,9 +933,9 @@ def test_cancel_run_idempotent() -> None:
         artifact_store=DummyArtifactStore(),
     )
     run = Run(run_id="run_done", root_node_run_id="root", state=RunState.canceled)
-    asyncio.run(run_store.create_run(run))
+    runner.run(run_store.create_run(run))
 
-    canceled = asyncio.run(
+    canceled = runner.run(
         coordinator.cancel_run(
             RunCoordinatorCancelRunRequest(
                 params=RunCoordinatorCancelRunParams(run_id=run.run_id)
@@ -655,8 +944,19 @@ def test_cancel_run_idempotent() -> None:
     )
     assert canceled.state == RunState.canceled
 
+    with pytest.raises(ArpServerError) as excinfo:
+        runner.run(
+            coordinator.cancel_run(
+                RunCoordinatorCancelRunRequest(
+                    params=RunCoordinatorCancelRunParams(run_id="run_missing")
+                )
+            )
+        )
+    assert excinfo.value.code == "run_not_found"
+    assert excinfo.value.status_code == 404
+
 
-def test_stream_node_run_events_filters_descendants() -> None:
+def test_stream_node_run_events_filters_descendants(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     event_stream = InMemoryEventStream()
     coordinator = RunCoordinator(
@@ -665,25 +965,25 @@ def test_stream_node_run_events_filters_descendants() -> None:
         artifact_store=DummyArtifactStore(),
     )
     run = Run(run_id="run_events", root_node_run_id="root", state=RunState.running)
-    asyncio.run(run_store.create_run(run))
+    runner.run(run_store.create_run(run))
     root = NodeRun(
         node_run_id="root",
         run_id=run.run_id,
         parent_node_run_id=None,
-        node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
+        node_type_ref=_COMPOSITE_ECHO_REF,
         state=NodeRunState.queued,
     )
     child = NodeRun(
         node_run_id="child",
         run_id=run.run_id,
         parent_node_run_id="root",
-        node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+        node_type_ref=_ATOMIC_ECHO_REF,
         state=NodeRunState.queued,
     )
-    asyncio.run(run_store.create_node_run(root))
-    asyncio.run(run_store.create_node_run(child))
+    runner.run(run_store.create_node_run(root))
+    runner.run(run_store.create_node_run(child))
 
-    asyncio.run(
+    runner.run(
         event_stream.append_events(
             [
                 {"run_id": run.run_id, "node_run_id": "root", "type": "event"},
@@ -693,7 +993,7 @@ def test_stream_node_run_events_filters_descendants() -> None:
         )
     )
 
-    response = asyncio.run(
+    response = runner.run(
         coordinator.stream_node_run_events(
             RunCoordinatorStreamNodeRunEventsRequest(
                 params=RunCoordinatorStreamNodeRunEventsParams(node_run_id="root")
@@ -705,7 +1005,7 @@ def test_stream_node_run_events_filters_descendants() -> None:
     assert '"node_run_id":"other"' not in response
 
 
-def test_report_node_run_evaluation_records() -> None:
+def test_report_node_run_evaluation_records(runner: asyncio.Runner) -> None:
     run_store = InMemoryRunStore()
     event_stream = InMemoryEventStream()
     coordinator = RunCoordinator(
@@ -714,19 +1014,19 @@ def test_report_node_run_evaluation_records() -> None:
         artifact_store=DummyArtifactStore(),
     )
     run = Run(run_id="run_eval", root_node_run_id="root", state=RunState.running)
-    asyncio.run(run_store.create_run(run))
+    runner.run(run_store.create_run(run))
     node_run = NodeRun(
         node_run_id="node_eval",
         run_id=run.run_id,
         parent_node_run_id="root",
-        node_type_ref=NodeTypeRef(node_type_id="atomic.echo", version="0.1.0"),
+        node_type_ref=_ATOMIC_ECHO_REF,
         state=NodeRunState.running,
     )
-    asyncio.run(run_store.create_node_run(node_run))
+    runner.run(run_store.create_node_run(node_run))
 
     evaluation = EvaluationResult(status=EvaluationStatus.success)
     recovery = RecoveryAction(type=RecoveryActionType.retry)
-    asyncio.run(
+    runner.run(
         coordinator.report_node_run_evaluation(
             RunCoordinatorReportNodeRunEvaluationRequest(
                 params=RunCoordinatorReportNodeRunEvaluationParams(node_run_id="node_eval"),
@@ -738,7 +1038,7 @@ def test_report_node_run_evaluation_records() -> None:
         )
     )
 
-    updated = asyncio.run(run_store.get_node_run("node_eval"))
+    updated = runner.run(run_store.get_node_run("node_eval"))
     assert updated is not None
     assert updated.evaluation_result is not None
     assert updated.recovery_actions
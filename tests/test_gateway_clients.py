@@ -2,8 +2,10 @@ import asyncio
 from datetime import datetime, timezone
 from typing import Any, cast
 
+import httpx
 import pytest
 from arp_auth import AuthClient
+from arp_standard_client.atomic_executor import AtomicExecutorClient
 from arp_standard_client.errors import ArpApiError
 from arp_standard_model import (
     AtomicExecuteRequest,
@@ -29,11 +31,8 @@ from arp_standard_model import (
 )
 from arp_standard_server import ArpServerError
 
-import jarvis_run_coordinator.clients.atomic_executor_client as atomic_module
-import jarvis_run_coordinator.clients.composite_executor_client as composite_module
-import jarvis_run_coordinator.clients.node_registry_client as registry_module
-import jarvis_run_coordinator.clients.pdp_client as pdp_module
-import jarvis_run_coordinator.clients.selection_client as selection_module
+import jarvis_run_coordinator.clients._gateway as gateway_module
+from jarvis_run_coordinator.clients import register_inprocess_server, unregister_inprocess_server
 from jarvis_run_coordinator.clients.atomic_executor_client import AtomicExecutorGatewayClient
 from jarvis_run_coordinator.clients.composite_executor_client import CompositeExecutorGatewayClient
 from jarvis_run_coordinator.clients.node_registry_client import NodeRegistryGatewayClient
@@ -44,11 +43,21 @@ from jarvis_run_coordinator.clients.selection_client import SelectionGatewayClie
 class DummyRawClient:
     def __init__(self) -> None:
         self.headers: dict[str, str] = {}
+        self.async_client: object | None = None
 
     def with_headers(self, headers: dict[str, str]):
         self.headers = headers
         return self
 
+    def get_async_httpx_client(self):
+        if self.async_client is None:
+            self.async_client = object()
+        return self.async_client
+
+    def set_async_httpx_client(self, async_client):
+        self.async_client = async_client
+        return self
+
 
 class DummyClient:
     def __init__(self, responses: dict[str, object]):
@@ -56,7 +65,7 @@ class DummyClient:
         self._responses = responses
 
     def __getattr__(self, name: str):
-        def handler(_request):
+        async def handler(_request):
             value = self._responses[name]
             if isinstance(value, Exception):
                 raise value
@@ -96,7 +105,7 @@ def test_atomic_executor_gateway_success(monkeypatch) -> None:
         "version": _version(),
     }
     dummy = DummyClient(responses)
-    monkeypatch.setattr(atomic_module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
 
     gateway = AtomicExecutorGatewayClient(
         base_url="http://atomic",
@@ -113,6 +122,8 @@ def test_atomic_executor_gateway_success(monkeypatch) -> None:
     )
     result = asyncio.run(gateway.execute_atomic_node_run(request))
     assert result.node_run_id == "node-1"
+    results = asyncio.run(gateway.execute_many([request, request]))
+    assert [item.node_run_id for item in results] == ["node-1", "node-1"]
     assert asyncio.run(gateway.cancel_atomic_node_run("node-1")) is None
     assert asyncio.run(gateway.health()).status == Status.ok
     assert asyncio.run(gateway.version()).service_name == "svc"
@@ -130,7 +141,7 @@ def test_composite_executor_gateway_success(monkeypatch) -> None:
         "version": _version(),
     }
     dummy = DummyClient(responses)
-    monkeypatch.setattr(composite_module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
 
     gateway = CompositeExecutorGatewayClient(
         base_url="http://composite",
@@ -148,6 +159,7 @@ def test_composite_executor_gateway_success(monkeypatch) -> None:
     )
     result = asyncio.run(gateway.begin_composite_node_run(request))
     assert result.accepted
+    assert all(item.accepted for item in asyncio.run(gateway.begin_many([request, request])))
     assert asyncio.run(gateway.cancel_composite_node_run("node-1")) is None
     assert asyncio.run(gateway.health()).status == Status.ok
     assert asyncio.run(gateway.version()).service_name == "svc"
@@ -169,7 +181,7 @@ def test_selection_gateway_success(monkeypatch) -> None:
         "version": _version(),
     }
     dummy = DummyClient(responses)
-    monkeypatch.setattr(selection_module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
 
     gateway = SelectionGatewayClient(
         base_url="http://selection",
@@ -205,7 +217,7 @@ def test_node_registry_gateway_success(monkeypatch) -> None:
         "version": _version(),
     }
     dummy = DummyClient(responses)
-    monkeypatch.setattr(registry_module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
 
     gateway = NodeRegistryGatewayClient(
         base_url="http://registry",
@@ -242,7 +254,7 @@ def test_node_registry_gateway_skips_auth_when_disabled(monkeypatch) -> None:
         raise AssertionError("client_credentials_token should not be called when ARP_AUTH_MODE=disabled")
 
     monkeypatch.setenv("ARP_AUTH_MODE", "disabled")
-    monkeypatch.setattr(registry_module, "client_credentials_token", _should_not_be_called)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _should_not_be_called)
 
     gateway = NodeRegistryGatewayClient(
         base_url="http://registry",
@@ -263,7 +275,7 @@ def test_pdp_gateway_success(monkeypatch) -> None:
         "version": _version(),
     }
     dummy = DummyClient(responses)
-    monkeypatch.setattr(pdp_module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
 
     gateway = PdpGatewayClient(
         base_url="http://pdp",
@@ -280,18 +292,18 @@ def test_pdp_gateway_success(monkeypatch) -> None:
 
 
 @pytest.mark.parametrize(
-    "gateway_cls, module, error_code",
+    "gateway_cls, error_code",
     [
-        (AtomicExecutorGatewayClient, atomic_module, "atomic_executor_unavailable"),
-        (CompositeExecutorGatewayClient, composite_module, "composite_executor_unavailable"),
-        (SelectionGatewayClient, selection_module, "selection_service_unavailable"),
-        (NodeRegistryGatewayClient, registry_module, "node_registry_unavailable"),
-        (PdpGatewayClient, pdp_module, "pdp_unavailable"),
+        (AtomicExecutorGatewayClient, "atomic_executor_unavailable"),
+        (CompositeExecutorGatewayClient, "composite_executor_unavailable"),
+        (SelectionGatewayClient, "selection_service_unavailable"),
+        (NodeRegistryGatewayClient, "node_registry_unavailable"),
+        (PdpGatewayClient, "pdp_unavailable"),
     ],
 )
-def test_gateway_generic_error(monkeypatch, gateway_cls, module, error_code) -> None:
+def test_gateway_generic_error(monkeypatch, gateway_cls, error_code) -> None:
     dummy = DummyClient({"health": RuntimeError("boom")})
-    monkeypatch.setattr(module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
     gateway = gateway_cls(
         base_url="http://svc",
         auth_client=cast(AuthClient, DummyAuthClient()),
@@ -304,20 +316,20 @@ def test_gateway_generic_error(monkeypatch, gateway_cls, module, error_code) ->
 
 
 @pytest.mark.parametrize(
-    "gateway_cls, module",
+    "gateway_cls",
     [
-        (AtomicExecutorGatewayClient, atomic_module),
-        (CompositeExecutorGatewayClient, composite_module),
-        (SelectionGatewayClient, selection_module),
-        (NodeRegistryGatewayClient, registry_module),
-        (PdpGatewayClient, pdp_module),
+        AtomicExecutorGatewayClient,
+        CompositeExecutorGatewayClient,
+        SelectionGatewayClient,
+        NodeRegistryGatewayClient,
+        PdpGatewayClient,
     ],
 )
-def test_gateway_arp_api_error(monkeypatch, gateway_cls, module) -> None:
+def test_gateway_arp_api_error(monkeypatch, gateway_cls) -> None:
     dummy = DummyClient(
         {"health": ArpApiError("nope", "bad", status_code=418, details={"x": "y"})}
     )
-    monkeypatch.setattr(module, "client_credentials_token", _fake_token)
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
     gateway = gateway_cls(
         base_url="http://svc",
         auth_client=cast(AuthClient, DummyAuthClient()),
@@ -328,3 +340,119 @@ def test_gateway_arp_api_error(monkeypatch, gateway_cls, module) -> None:
         asyncio.run(gateway.health())
     assert excinfo.value.code == "nope"
     assert excinfo.value.status_code == 418
+
+
+def test_atomic_executor_gateway_uses_shared_async_client(monkeypatch) -> None:
+    seen: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("Authorization")))
+        if request.url.path == "/v1/atomic-node-runs:execute":
+            return httpx.Response(200, json={"node_run_id": "node-1", "state": "succeeded"})
+        return httpx.Response(
+            503,
+            json={"error": {"code": "executor_busy", "message": "busy"}},
+        )
+
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _fake_token)
+    sdk_client = AtomicExecutorClient(base_url="http://atomic")
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://atomic")
+    sdk_client.raw_client.set_async_httpx_client(http_client)
+    gateway = AtomicExecutorGatewayClient(
+        base_url="http://atomic",
+        auth_client=cast(AuthClient, DummyAuthClient()),
+        client=sdk_client,
+    )
+
+    request = AtomicExecuteRequest(
+        run_id="run-1",
+        node_run_id="node-1",
+        node_type_ref=NodeTypeRef(node_type_id="jarvis.core.echo", version="0.3.8"),
+        inputs={},
+    )
+
+    async def _scenario():
+        result = await gateway.execute_atomic_node_run(request)
+        with pytest.raises(ArpServerError) as excinfo:
+            await gateway.health()
+        client = await gateway._client_for()
+        return result, excinfo.value, client
+
+    result, error, client = asyncio.run(_scenario())
+    assert result.state == NodeRunState.succeeded
+    assert error.code == "executor_busy"
+    assert error.status_code == 503
+    assert client.raw_client.get_async_httpx_client() is http_client
+    assert seen == [
+        ("/v1/atomic-node-runs:execute", "Bearer token"),
+        ("/v1/health", "Bearer token"),
+    ]
+
+
+def test_atomic_executor_gateway_inprocess(monkeypatch) -> None:
+    class InProcessAtomicExecutor:
+        async def execute_atomic_node_run(self, request):
+            return AtomicExecuteResult(node_run_id=request.body.node_run_id, state=NodeRunState.succeeded)
+
+        async def health(self, request):
+            _ = request
+            raise ArpServerError(code="executor_busy", message="busy", status_code=503)
+
+    async def _no_token(*_args, **_kwargs) -> str:
+        raise AssertionError("in-process calls must not fetch tokens")
+
+    monkeypatch.setattr(gateway_module, "client_credentials_token", _no_token)
+    gateway = AtomicExecutorGatewayClient(
+        base_url="inprocess://atomic",
+        auth_client=cast(AuthClient, DummyAuthClient()),
+    )
+    request = AtomicExecuteRequest(
+        run_id="run-1",
+        node_run_id="node-1",
+        node_type_ref=NodeTypeRef(node_type_id="jarvis.core.echo", version="0.3.8"),
+        inputs={},
+    )
+
+    with pytest.raises(ArpServerError) as excinfo:
+        asyncio.run(gateway.execute_atomic_node_run(request))
+    assert excinfo.value.code == "atomic_executor_unavailable"
+
+    register_inprocess_server("inprocess://atomic", InProcessAtomicExecutor())
+    try:
+        result = asyncio.run(gateway.execute_atomic_node_run(request))
+        with pytest.raises(ArpServerError) as excinfo:
+            asyncio.run(gateway.health())
+    finally:
+        unregister_inprocess_server("inprocess://atomic")
+    assert result.node_run_id == "node-1"
+    assert excinfo.value.code == "executor_busy"
+    assert excinfo.value.status_code == 503
+
+    with pytest.raises(ValueError):
+        register_inprocess_server("http://atomic", InProcessAtomicExecutor())
+
+
+@pytest.mark.parametrize(
+    "gateway_cls",
+    [
+        AtomicExecutorGatewayClient,
+        CompositeExecutorGatewayClient,
+        SelectionGatewayClient,
+        NodeRegistryGatewayClient,
+        PdpGatewayClient,
+    ],
+)
+def test_gateway_default_client_pools_connections(monkeypatch: pytest.MonkeyPatch, gateway_cls) -> None:
+    created: list[dict[str, Any]] = []
+
+    def fake_async_client(**kwargs: Any) -> object:
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(httpx, "AsyncClient", fake_async_client)
+    gateway = gateway_cls(base_url="http://svc", auth_client=cast(AuthClient, DummyAuthClient()))
+    gateway._client.raw_client.get_async_httpx_client()
+
+    assert len(created) == 1
+    assert created[0]["http2"] is True
+    assert created[0]["limits"] is gateway_module.GATEWAY_HTTP_LIMITS
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from typing import cast
 
 import httpx
@@ -28,9 +29,12 @@ def _node_run(node_run_id: str = "node-1", run_id: str = "run-1") -> NodeRun:
 def test_run_store_client_basic_flow() -> None:
     run = _run()
     node_run = _node_run()
+    bodies: list[tuple[str | None, object]] = []
 
     def handler(request: httpx.Request) -> httpx.Response:
         path = request.url.path
+        if request.content:
+            bodies.append((request.headers.get("Content-Type"), json.loads(request.content)))
         if request.method == "POST" and path == "/v1/runs":
             return httpx.Response(200, json={"run": run.model_dump(mode="json")})
         if request.method == "GET" and path == "/v1/runs/run-1":
@@ -76,6 +80,12 @@ def test_run_store_client_basic_flow() -> None:
 
     listed = asyncio.run(store.list_node_runs_for_run(run.run_id))
     assert listed
+    assert bodies == [
+        ("application/json", {"run": run.model_dump(mode="json"), "idempotency_key": "run-1"}),
+        ("application/json", {"run": run.model_dump(mode="json")}),
+        ("application/json", {"node_run": node_run.model_dump(mode="json"), "idempotency_key": "step-1"}),
+        ("application/json", {"node_run": node_run.model_dump(mode="json")}),
+    ]
 
     asyncio.run(client.aclose())
 
@@ -149,6 +159,12 @@ def test_run_store_invalid_json_and_request_failure() -> None:
     with pytest.raises(ArpServerError) as excinfo:
         asyncio.run(store.create_run(_run()))
     assert excinfo.value.code == "run_store_unavailable"
+
+    # A body that cannot be encoded is reported the same way.
+    unencodable = _node_run().model_copy(update={"inputs": {"value": object()}})
+    with pytest.raises(ArpServerError) as excinfo:
+        asyncio.run(store.create_node_run(unencodable))
+    assert excinfo.value.code == "run_store_unavailable"
     asyncio.run(client.aclose())
 
 
@@ -183,8 +199,11 @@ def test_run_store_auth_header_and_error_detail(monkeypatch: pytest.MonkeyPatch)
 
 
 def test_event_stream_client() -> None:
+    bodies: list[tuple[str | None, object]] = []
+
     def handler(request: httpx.Request) -> httpx.Response:
         if request.method == "POST" and request.url.path == "/v1/run-events":
+            bodies.append((request.headers.get("Content-Type"), json.loads(request.content)))
             return httpx.Response(200, json={"items": []})
         if request.method == "GET" and request.url.path.startswith("/v1/runs/"):
             return httpx.Response(200, text="{}\n")
@@ -199,6 +218,7 @@ def test_event_stream_client() -> None:
 
     result = asyncio.run(stream.append_events([{"run_id": "run-1"}]))
     assert result["items"] == []
+    assert bodies == [("application/json", {"events": [{"run_id": "run-1"}]})]
     assert asyncio.run(stream.stream_run_events("run-1")).strip() == "{}"
     assert asyncio.run(stream.stream_node_run_events("node-1")).strip() == "{}"
 
@@ -237,6 +257,16 @@ def test_event_stream_request_failure() -> None:
     with pytest.raises(ArpServerError) as excinfo:
         asyncio.run(stream.append_events([{"run_id": "run-1"}]))
     assert excinfo.value.code == "event_stream_unavailable"
+
+    # A body that cannot be encoded is reported the same way.
+    with pytest.raises(ArpServerError) as excinfo:
+        asyncio.run(stream.append_events([{"run_id": "run-1", "data": object()}]))
+    assert excinfo.value.code == "event_stream_unavailable"
+
+    # Non-finite floats are not valid JSON and are rejected before sending.
+    with pytest.raises(ArpServerError) as excinfo:
+        asyncio.run(stream.append_events([{"run_id": "run-1", "data": {"score": float("nan")}}]))
+    assert excinfo.value.code == "event_stream_unavailable"
     asyncio.run(client.aclose())
 
 